@@ -1,13 +1,54 @@
-from playwright.sync_api import sync_playwright
+from playwright.async_api import async_playwright
 import pytest
-import time
-from urllib.parse import urljoin, urlparse, urlunparse
-import re
-
-BASE_URL = "https://frymaster.bwd-003.borders.dev/"
-MAX_PAGES = 10  # safety cap (reduced for quicker runs)
+import asyncio
+import os
+import sys
+from urllib.parse import urljoin, urlparse
+
+# Add the shared scanner helpers to the path for imports
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), os.pardir, "common"))
+
+from browser_server import launch_or_connect_async
+from canonical import canonicalize, normalize_url
+from check_engine import CHECK_QUEUE_SIZE, CheckPipeline, is_broken_status
+from crawl_profile import CrawlProfile
+from crawler import RetryLater, TimeBudget, crawl, parse_duration
+from extract import extract_page_urls_async
+from fingerprint import NearDuplicateTracker
+from http_backend import open_backend
+from politeness import HostScheduler
+from priority import CrawlPriority
+from readiness import summarize, wait_until_ready
+from report import ResultStream
+from scan_store import PersistentFrontier, ScanStore
+from response_recorder import ResponseRecorder, find_broken_rendered_images
+from sharding import run_sharded, spawn_queue
+from sitemaps import fetch_robots, iter_sitemap_urls, unchanged_since_crawl
+from static_discovery import fetch_static, needs_render
+from status_cache import StatusCache
+
+BASE_URL = canonicalize("https://frymaster.bwd-003.borders.dev/")
+# The crawl stops starting new pages once this wall-clock budget is spent ("480", "90s", "8m", "1h30m");
+# pages are visited in CrawlPriority order so the budget goes to the most valuable ones first
+CRAWL_TIME_BUDGET = parse_duration(os.environ.get("SCAN_TIME_BUDGET", "8m"))
+# optional page cap on top of the time budget (per shard when sharded)
+MAX_PAGES = int(os.environ["SCAN_MAX_PAGES"]) if os.environ.get("SCAN_MAX_PAGES") else None
+CRAWL_POOL_SIZE = 4  # browser contexts crawling in parallel
+# >1 crawls in that many processes, each with its own browser and hash-partitioned share of URLs
+SHARDS = int(os.environ.get("SCAN_SHARDS", "1"))
 REQUEST_TIMEOUT_MS = 10000
 RETRY_COUNT = 3
+CHECK_CONCURRENCY = 16  # parallel image/link status checks
+# "static" fetches and parses server HTML, rendering only JS-dependent pages; "render" always renders
+DISCOVERY_MODE = os.environ.get("SCAN_DISCOVERY_MODE", "render")
+# Seed the frontier from robots.txt Sitemap: entries (or /sitemap.xml); "0" crawls from BASE_URL only
+SITEMAP_SEEDING = os.environ.get("SCAN_SITEMAPS", "1") != "0"
+# URL regexes for pages whose links only exist after JavaScript runs (always rendered)
+RENDER_PATTERNS = [
+]
+# Per-URL readiness overrides: (regex, "dom-quiet" | "networkidle" | "load" | "domcontentloaded")
+READINESS_OVERRIDES = [
+]
 
 
 # Known/expected broken assets or paths to ignore (substring match)
@@ -24,31 +65,6 @@ ALLOWLIST_SUBSTRINGS = [
 ]
 
 
-def normalize_url(base, link):
-    if not link:
-        return None
-    link = link.strip()
-    if link.startswith("javascript:") or link.startswith("mailto:") or link.startswith("tel:"):
-        return None
-    if link.startswith("#"):
-        return None
-    joined = urljoin(base, link)
-    return _clean_url(joined)
-
-
-def _clean_url(u: str) -> str:
-    # Remove accidental duplicated slashes in path (but preserve protocol //host)
-    try:
-        parsed = urlparse(u)
-        # collapse multiple slashes in path
-        clean_path = re.sub(r'/{2,}', '/', parsed.path)
-        # keep query and fragment
-        rebuilt = urlunparse((parsed.scheme, parsed.netloc, clean_path, parsed.params, parsed.query, parsed.fragment))
-        return rebuilt
-    except Exception:
-        return u
-
-
 def is_same_origin(a, b):
     pa = urlparse(a)
     pb = urlparse(b)
@@ -64,156 +80,372 @@ def is_allowlisted(u: str) -> bool:
     return False
 
 
-def safe_request(request_ctx, method, url):
-    last_exc = None
-    for attempt in range(1, RETRY_COUNT + 1):
-        try:
-            if method.lower() == "head":
-                # Some servers don't support HEAD; we'll try HEAD then fallback to GET in caller
-                resp = request_ctx.head(url, timeout=REQUEST_TIMEOUT_MS)
+async def safe_goto(page, url):
+    # a failed navigation raises and is retried by re-queueing (see visit);
+    # readiness timeouts are recorded, not failures
+    await page.goto(url, timeout=REQUEST_TIMEOUT_MS, wait_until="domcontentloaded")
+    return await wait_until_ready(page, url, READINESS_OVERRIDES, timeout_ms=REQUEST_TIMEOUT_MS)
+
+
+class CrawlResult:
+    """Everything one crawl (or one crawl shard) discovered; picklable for shard hand-off."""
+
+    def __init__(self, recorder=None):
+        self.pages_visited = 0
+        self.found_images = set()
+        self.found_links = set()
+        self.blocked_images = set()  # first-party images the crawl profile aborted
+        self.readiness_log = []  # ReadinessDecision per rendered page
+        self.blocked_count = 0
+        self.fingerprints = []  # NearDuplicateTracker decision per crawled page
+        self.recorder = recorder or ResponseRecorder()
+
+    def merge(self, other):
+        self.pages_visited += other.pages_visited
+        self.found_images |= other.found_images
+        self.found_links |= other.found_links
+        self.blocked_images |= other.blocked_images
+        self.readiness_log.extend(other.readiness_log)
+        self.blocked_count += other.blocked_count
+        self.fingerprints.extend(other.fingerprints)
+        self.recorder.merge(other.recorder)
+        return self
+
+
+async def _crawl_site(browser, request_ctx, frontier, budget, emit, recorder=None, scheduler=None, robots=None):
+    """Crawl from ``frontier`` and ``await emit(kind, url, status)`` for every URL worth checking.
+
+    Images and external links are emitted as soon as they are found, crawled
+    pages once their own status is known.  ``status`` is final when not None.
+    Navigations and static fetches are paced by the per-host ``scheduler``.
+    Pages that keep rendering near-duplicates of their URL pattern (facets,
+    sort orders, calendars) stop feeding the frontier; their links are still
+    reported through ``found_links``.  With shards, near-duplicates are
+    tracked per shard.  Pages disallowed by ``robots`` are checked, not crawled.
+    """
+    result = CrawlResult(recorder)
+    recorder = result.recorder
+    scheduler = scheduler or HostScheduler()
+    profile = CrawlProfile()
+    duplicates = NearDuplicateTracker()
+    attempts = {}  # failed navigation attempts per URL
+
+    async def setup_page(page):
+        # keep the status of everything Chromium fetches so it is not requested twice
+        recorder.attach(page)
+        # skip fonts, media and third-party tags during discovery navigations
+        await profile.attach_async(page)
+
+    async def collect(url, links, images, rendered_broken=(), text=None):
+        for src in images:
+            full = normalize_url(url, src)
+            if not full or full in result.found_images:
+                continue
+            result.found_images.add(full)
+            observed = recorder.status_for(full)
+            if not isinstance(observed, int):
+                observed = None
+            if full in rendered_broken and not (observed and observed >= 400):
+                observed = "rendered-broken: naturalWidth == 0"
+            await emit("image", full, observed)
+
+        links = [full for full in (normalize_url(url, href) for href in links) if full]
+        prune = False
+        if text is not None:
+            decision = duplicates.observe(url, sorted(set(links)), text)
+            prune = decision["prune"]
+            decision["pruned_children"] = 0
+            result.fingerprints.append(decision)
+
+        for full in links:
+            if full in result.found_links:
+                continue
+            result.found_links.add(full)
+            if is_same_origin(BASE_URL, full) and (robots is None or robots.allowed(full)):
+                if prune:
+                    decision["pruned_children"] += 1
+                    continue
+                # queue same-origin internal pages for crawling; the visit reports their status
+                frontier.push(full, parent=url)
             else:
-                resp = request_ctx.get(url, timeout=REQUEST_TIMEOUT_MS)
-            return resp
-        except Exception as e:
-            last_exc = e
-            time.sleep(1 * attempt)
-    raise last_exc
-
+                await emit("link", full, None)
+        if prune:
+            print(f"  ✂ Near-duplicate of {decision['pattern']}, not crawling its "
+                  f"{decision['pruned_children']} new links")
 
-def safe_goto(page, url):
-    last_exc = None
-    for attempt in range(1, RETRY_COUNT + 1):
+    async def visit_static(url):
+        """Discover links from server HTML; return False if the page must be rendered."""
         try:
-            page.goto(url, timeout=REQUEST_TIMEOUT_MS)
-            page.wait_for_load_state("networkidle", timeout=REQUEST_TIMEOUT_MS)
+            await scheduler.acquire(url)
+            status, extractor = await fetch_static(request_ctx, url, REQUEST_TIMEOUT_MS)
+        except Exception as e:
+            print(f"  ⚠️ Static fetch failed for {url}, rendering instead: {e}")
+            return False
+        scheduler.record(url, status < 500)
+        recorder.record(url, status)
+        if status >= 400:
+            await emit("link", url, f"load-failure: HTTP {status}")
+            return True
+        if extractor is None:
+            await emit("link", url, status)
+            return True  # not HTML, nothing to discover
+        if needs_render(url, extractor, RENDER_PATTERNS):
+            print(f"  ↻ JS-dependent page, rendering: {url}")
+            return False
+        await emit("link", url, status)
+        await collect(url, extractor.links, extractor.images, text=extractor.text)
+        return True
+
+    async def visit(page, url):
+        print(f"Visiting: {url}")
+        if not scheduler.allow(url):
+            await emit("link", url, scheduler.circuit_open_status(url))
+            return
+        if DISCOVERY_MODE == "static" and await visit_static(url):
             return
+        try:
+            await scheduler.acquire(url)
+            decision = await safe_goto(page, url)
         except Exception as e:
-            last_exc = e
-            print(f"  ⚠️ goto attempt {attempt} failed for {url}: {e}")
-            time.sleep(attempt)
-    raise last_exc
-
-
-@pytest.mark.broken_assets
-def test_scan_broken_images_and_links():
-    visited = set()
-    to_visit = [BASE_URL]
-    found_images = set()
-    found_links = set()
-
+            scheduler.record(url, False)
+            attempt = attempts[url] = attempts.get(url, 0) + 1
+            if attempt < RETRY_COUNT and not scheduler.is_open(url):
+                delay = scheduler.backoff(attempt)
+                print(f"  ⚠️ goto attempt {attempt} failed for {url}, retrying in {delay:.1f}s: {e}")
+                raise RetryLater(delay)
+            print(f"  ⚠️ Failed to load {url}: {e}")
+            # treat page load failure as broken link
+            await emit("link", url, f"load-failure: {e}")
+            return
+        scheduler.record(url, True)
+        result.readiness_log.append(decision)
+        print(f"  ready via {decision.strategy} in {decision.elapsed_ms} ms"
+              + ("" if decision.ready else " (timed out, using page as-is)"))
+        status = recorder.status_for(url)
+        await emit("link", url, status if isinstance(status, int) else None)
+
+        # collect images and anchor links in one round-trip
+        extracted = await extract_page_urls_async(page)
+        blocked = profile.blocked_urls()
+        rendered_broken = set()
+        for src in await find_broken_rendered_images(page):
+            full = normalize_url(url, src)
+            # an image we aborted ourselves did not render, but is not broken
+            if full and src not in blocked:
+                rendered_broken.add(full)
+        await collect(url, extracted["links"], extracted["images"], rendered_broken, extracted["text"])
+
+    result.pages_visited = await crawl(browser, frontier, visit, budget, pool_size=CRAWL_POOL_SIZE,
+                                       setup_page=setup_page)
+    result.blocked_count = len(profile.blocked)
+    result.blocked_images = profile.blocked_first_party_images(BASE_URL)
+    return result
+
+
+def _crawl_shard(frontier, budget, discoveries, robots):
+    """Shard process entry point: own Playwright driver and browser, crawl this shard's URLs.
+
+    Shards always launch their own browser, even with the browser server
+    running: sharing one Chromium would serialize them again.
+    """
+    async def emit(kind, url, status=None):
+        # the parent process runs the check pipeline; hand discoveries over as they appear
+        await asyncio.to_thread(discoveries.put, (kind, url, status))
+
+    async def run():
+        async with async_playwright() as p:
+            browser = await p.chromium.launch(headless=False)
+            request_ctx = await open_backend(p)
+            try:
+                return await _crawl_site(browser, request_ctx, frontier, budget, emit, robots=robots)
+            finally:
+                await request_ctx.dispose()
+                await browser.close()
+
+    return asyncio.run(run())
+
+
+async def _seed_from_sitemaps(request_ctx, robots, priority, cache, add) -> tuple:
+    """Stream same-origin sitemap URLs into ``add(url)`` as they are parsed.
+
+    Sitemap ``<priority>`` feeds the crawl order.  Healthy pages whose
+    ``<lastmod>`` predates their last crawl are returned instead of seeded:
+    they only need a cheap conditional status check, not a render.
+    """
+    seeded = 0
+    unchanged = []
+    sitemap_urls = robots.sitemaps or [urljoin(BASE_URL, "/sitemap.xml")]
+    async for entry in iter_sitemap_urls(request_ctx, sitemap_urls, REQUEST_TIMEOUT_MS):
+        url = canonicalize(entry.url)
+        if not is_same_origin(BASE_URL, url) or not robots.allowed(url):
+            continue
+        if entry.priority is not None:
+            priority.set_sitemap_priority(url, entry.priority)
+        if unchanged_since_crawl(cache.get(url), entry.lastmod):
+            unchanged.append(url)
+            continue
+        add(url)
+        seeded += 1
+    return seeded, unchanged
+
+
+async def _scan():
     broken_images = []
     broken_links = []
-
-    with sync_playwright() as p:
-        browser = p.chromium.launch(headless=False)
-        page = browser.new_page()
-        request_ctx = p.request.new_context()
+    skipped = set()
+    recorder = ResponseRecorder()
+    scheduler = HostScheduler()  # shared by navigations and checks in this process
+    stream = ResultStream()
+    # with SCAN_RESUME set, continue the last run's frontier and reuse its check results
+    store = ScanStore()
+    if store.resumed:
+        print(f"Resuming scan: {len(store.queued())} pages queued, {len(store.visited())} visited, "
+              f"{store.checked_count} URLs already checked")
+
+    def on_result(kind, url, status):
+        # results are streamed as they complete, while the crawl is still running
+        store.record_result(kind, url, status)
+        stream.write("result", kind=kind, url=url, status=status)
+        if is_broken_status(status):
+            print(f"  ✗ Broken {kind} ({_describe(status)}): {url}")
+            (broken_images if kind == "image" else broken_links).append((url, status))
+        else:
+            print(f"  ✓ OK {kind} (HTTP {status}): {url}")
+
+    async with async_playwright() as p:
+        # status checks, static fetches and sitemaps go through the SCAN_CHECK_BACKEND client
+        request_ctx = await open_backend(p)
+        cache = StatusCache()
+        priority = CrawlPriority(cache)
+        budget = TimeBudget(CRAWL_TIME_BUDGET, MAX_PAGES)
 
         try:
-            while to_visit and len(visited) < MAX_PAGES:
-                url = to_visit.pop(0)
-                if url in visited:
-                    continue
-                print(f"Visiting: {url}")
-                try:
-                    safe_goto(page, url)
-                except Exception as e:
-                    print(f"  ⚠️ Failed to load {url}: {e}")
-                    # treat page load failure as broken link
-                    if not is_allowlisted(url):
-                        broken_links.append((url, f"load-failure: {e}"))
-                    visited.add(url)
-                    continue
-
-                visited.add(url)
-
-                # collect images on the page
-                imgs = page.query_selector_all("img")
-                for img in imgs:
-                    src = img.get_attribute("src")
-                    full = normalize_url(url, src)
-                    if full:
-                        found_images.add(full)
-
-                # collect anchor links
-                anchors = page.query_selector_all("a[href]")
-                for a in anchors:
-                    href = a.get_attribute("href")
-                    full = normalize_url(url, href)
-                    if not full:
-                        continue
-                    if full in found_links:
-                        continue
-                    found_links.add(full)
-                    # queue same-origin internal pages for crawling
-                    if is_same_origin(BASE_URL, full) and full not in visited and full not in to_visit:
-                        to_visit.append(full)
-
-            print(f"Collected {len(found_images)} images and {len(found_links)} links from {len(visited)} pages")
-
-            # Check images via HTTP request (HEAD then GET) and also check that response is OK
-            for img_url in sorted(found_images)[:100]:
-                if is_allowlisted(img_url):
-                    print(f"  - Skipping allowlisted image: {img_url}")
-                    continue
-                print(f"Checking image: {img_url}")
-                try:
-                    # try HEAD first
+            async with CheckPipeline(request_ctx, on_result, concurrency=CHECK_CONCURRENCY,
+                                     timeout_ms=REQUEST_TIMEOUT_MS, cache=cache,
+                                     lookup=recorder.status_for, scheduler=scheduler) as pipeline:
+
+                async def submit(kind, url, status=None):
+                    # skip mailto/tel/data
+                    if urlparse(url).scheme not in ("http", "https"):
+                        return
+                    if is_allowlisted(url):
+                        if url not in skipped:
+                            skipped.add(url)
+                            print(f"  - Skipping allowlisted {kind}: {url}")
+                        return
+                    store.record_found(kind, url)
+                    if isinstance(status, int) and kind == "link":
+                        cache.observed(url, status)  # crawled page: remember when it was last seen healthy
+                    await pipeline.submit(kind, url, status)
+
+                # an interrupted run's results are reported again, so its broken URLs still fail
+                # this run; the pipeline then skips them when the crawl finds them again
+                for kind, url, status in store.results():
+                    await pipeline.submit(kind, url, status)
+
+                # sitemap URLs go straight into the frontier (or the shard seeds) as they stream in
+                seeds = [BASE_URL]
+                frontier = None if SHARDS > 1 else PersistentFrontier(store, seeds, priority)
+                if SHARDS > 1:
+                    # as PersistentFrontier does: continue the stored queue, seeds only start a fresh one
+                    seeds = store.queued() or seeds
+                robots = await fetch_robots(request_ctx, BASE_URL, REQUEST_TIMEOUT_MS)
+                if SITEMAP_SEEDING:
+                    seeded, unchanged = await _seed_from_sitemaps(
+                        request_ctx, robots, priority, cache, frontier.push if frontier else seeds.append)
+                    print(f"Sitemaps: {seeded} pages seeded, {len(unchanged)} unchanged since their last crawl")
+                    for url in unchanged:
+                        await submit("link", url)
+
+                if SHARDS > 1:
+                    # shards report discoveries and frontier changes; this process checks and persists them
+                    print(f"Crawling with {SHARDS} shard processes")
+                    discoveries = spawn_queue(CHECK_QUEUE_SIZE)
+                    journal = spawn_queue()
+
+                    async def forward(source, handle):
+                        while True:
+                            item = await asyncio.to_thread(source.get)
+                            if item is None:
+                                return
+                            await handle(*item)
+
+                    async def persist(event, url):
+                        (store.enqueue if event == "queued" else store.mark_visited)(url)
+
+                    forwarders = [asyncio.create_task(forward(discoveries, submit)),
+                                  asyncio.create_task(forward(journal, persist))]
                     try:
-                        resp = safe_request(request_ctx, "head", img_url)
-                        status = resp.status
-                        # some servers respond to HEAD with 405; treat that by falling back
-                        if status >= 400:
-                            # fall back to GET
-                            resp = safe_request(request_ctx, "get", img_url)
-                            status = resp.status
-                    except Exception:
-                        # fallback to GET if HEAD failed
-                        resp = safe_request(request_ctx, "get", img_url)
-                        status = resp.status
-
-                    if status >= 400:
-                        print(f"  ✗ Broken image (HTTP {status}): {img_url}")
-                        broken_images.append((img_url, status))
-                    else:
-                        print(f"  ✓ OK (HTTP {status})")
-                except Exception as e:
-                    print(f"  ✗ Error checking image {img_url}: {e}")
-                    broken_images.append((img_url, str(e)))
-
-            # Check links via HEAD then GET
-            for link_url in sorted(found_links)[:200]:
-                # skip mailto/tel/data
-                parsed = urlparse(link_url)
-                if parsed.scheme not in ("http", "https"):
-                    continue
-                if is_allowlisted(link_url):
-                    print(f"  - Skipping allowlisted link: {link_url}")
-                    continue
-                print(f"Checking link: {link_url}")
-                try:
+                        shard_results = await asyncio.to_thread(
+                            run_sharded, _crawl_shard, SHARDS, seeds, extra_args=(discoveries, robots),
+                            budget=budget, priority=priority, seen=store.visited(), journal=journal)
+                    finally:
+                        discoveries.put(None)
+                        journal.put(None)
+                        await asyncio.gather(*forwarders)
+                    crawl_result = CrawlResult(recorder)
+                    for shard_result in shard_results:
+                        crawl_result.merge(shard_result)
+                else:
+                    browser = await launch_or_connect_async(p.chromium, headless=False)
                     try:
-                        resp = safe_request(request_ctx, "head", link_url)
-                        status = resp.status
-                        if status >= 400:
-                            resp = safe_request(request_ctx, "get", link_url)
-                            status = resp.status
-                    except Exception:
-                        resp = safe_request(request_ctx, "get", link_url)
-                        status = resp.status
-
-                    if status >= 400:
-                        print(f"  ✗ Broken link (HTTP {status}): {link_url}")
-                        broken_links.append((link_url, status))
-                    else:
-                        print(f"  ✓ OK (HTTP {status})")
-                except Exception as e:
-                    print(f"  ✗ Error checking link {link_url}: {e}")
-                    broken_links.append((link_url, str(e)))
+                        crawl_result = await _crawl_site(browser, request_ctx, frontier, budget,
+                                                         submit, recorder, scheduler, robots)
+                    finally:
+                        await browser.close()
+
+                print(f"Collected {len(crawl_result.found_images)} images and {len(crawl_result.found_links)} "
+                      f"links from {crawl_result.pages_visited} pages "
+                      f"({CRAWL_TIME_BUDGET - budget.remaining():.0f}s of a {CRAWL_TIME_BUDGET:.0f}s crawl budget)")
+                print(f"Browser observed {len(recorder)} responses during the crawl")
+                print(f"Page readiness: {summarize(crawl_result.readiness_log)}")
+                print(f"Crawl profile blocked {crawl_result.blocked_count} requests")
+                for decision in crawl_result.fingerprints:
+                    stream.write("prune" if decision["prune"] else "fingerprint", **decision)
+                pruned = [d for d in crawl_result.fingerprints if d["prune"]]
+                print(f"Near-duplicates: {sum(d['duplicate'] for d in crawl_result.fingerprints)} pages, "
+                      f"{len(pruned)} pruned ({sum(d['pruned_children'] for d in pruned)} links not crawled)")
+                stream.write("crawl-summary", pages=crawl_result.pages_visited,
+                             images=len(crawl_result.found_images), links=len(crawl_result.found_links),
+                             blocked=crawl_result.blocked_count)
+
+                # Everything found but not yet checked (pages left unvisited, blocked
+                # first-party images) goes through the pipeline as well: nothing is truncated.
+                for img_url in sorted(crawl_result.found_images | crawl_result.blocked_images):
+                    await submit("image", img_url)
+                for link_url in sorted(crawl_result.found_links):
+                    await submit("link", link_url)
+                # found by an earlier run but interrupted before its check finished
+                for kind, url in store.unchecked():
+                    await submit(kind, url)
+                store.checkpoint()
+
+            print(f"Checked over HTTP: {pipeline.http_checks} ({pipeline.retries_scheduled} retries re-queued); "
+                  f"status cache: {cache.hits} checks answered with 304 Not Modified")
+            if pipeline.prober.skipped_hosts():
+                print(f"HEAD unreliable, probed with ranged GETs: {', '.join(pipeline.prober.skipped_hosts())}")
+            if scheduler.open_hosts():
+                print(f"Circuit breaker open for: {', '.join(scheduler.open_hosts())}")
+            print(f"Streamed results to {stream.path}")
+            if store.queued():
+                print(f"{len(store.queued())} pages left unvisited; rerun with SCAN_RESUME=1 to continue")
 
         finally:
-            request_ctx.dispose()
-            browser.close()
+            cache.close()
+            store.close()
+            stream.close()
+            await request_ctx.dispose()
+
+    return broken_images, broken_links
+
+
+def _describe(status) -> str:
+    return f"HTTP {status}" if isinstance(status, int) else f"error: {status}"
+
+
+@pytest.mark.broken_assets
+def test_scan_broken_images_and_links():
+    broken_images, broken_links = asyncio.run(_scan())
 
     # remove any allowlisted items from results (extra safety)
     broken_images = [b for b in broken_images if not is_allowlisted(b[0])]
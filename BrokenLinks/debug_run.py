@@ -1,11 +1,18 @@
 from playwright.sync_api import sync_playwright
 from urllib.parse import urlparse, urljoin
+import os
+import sys
+
+# Add the shared scanner helpers to the path for imports
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), os.pardir, "common"))
+
+from browser_server import launch_or_connect
 
 BASE_URL = "https://frymaster.bwd-003.borders.dev/service#Software"
 PASSWORD = "tech"
 
 with sync_playwright() as p:
-    browser = p.chromium.launch(headless=True)
+    browser = launch_or_connect(p.chromium, headless=True)
     page = browser.new_page()
     request_ctx = p.request.new_context()
     try:
@@ -1,28 +1,43 @@
+from playwright.async_api import async_playwright
 from playwright.sync_api import sync_playwright, TimeoutError
 import pytest
-import time
-from urllib.parse import urljoin, urlparse
+import asyncio
+import os
+import sys
+from urllib.parse import urlparse
+
+# Add the shared scanner helpers to the path for imports
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), os.pardir, "common"))
+
+from browser_server import launch_or_connect
+from canonical import canonicalize, normalize_url
+from check_engine import check_urls
+from crawl_profile import CrawlProfile
+from extract import extract_page_urls
+from http_backend import open_backend
+from session_state import SessionState
+from status_cache import CACHE_DIR, StatusCache
 
 BASE_URL = "https://frymaster.bwd-003.borders.dev/service#Software"
 PASSWORD = "tech"
 REQUEST_TIMEOUT = 10
 RETRY_COUNT = 2
+CHECK_CONCURRENCY = 8  # parallel link checks (paced per host by the shared scheduler)
+# Opt-in lane for cross-origin links: checked in parallel with the internal ones, more gently
+CHECK_EXTERNAL = os.environ.get("LINKS_CHECK_EXTERNAL", "") not in ("", "0")
+EXTERNAL_CONCURRENCY = 4
+EXTERNAL_TIMEOUT = 5
+EXTERNAL_RETRY_COUNT = 1
+# external results are reused across runs for a day without re-requesting them
+EXTERNAL_CACHE_PATH = os.path.join(CACHE_DIR, "external_status_cache.sqlite")
+EXTERNAL_CACHE_TTL_SECONDS = 24 * 3600
+# Saved storage_state past the password gate, shared by runs, workers and the status checks
+SESSION_STATE_PATH = os.environ.get("LINKS_SESSION_STATE", os.path.join(CACHE_DIR, "links-session.json"))
 ALLOWLIST = [
     # Add substrings or exact URLs to ignore 404s
 ]
 
 
-def normalize_url(base, link):
-    if not link:
-        return None
-    link = link.strip()
-    if link.startswith(("javascript:", "mailto:", "tel:", "data:")):
-        return None
-    if link.startswith("#"):
-        return None
-    return urljoin(base, link)
-
-
 def is_allowlisted(u: str) -> bool:
     if not u:
         return False
@@ -32,27 +47,130 @@ def is_allowlisted(u: str) -> bool:
     return False
 
 
-def http_status(request_ctx, url):
-    last_exc = None
-    for attempt in range(1, RETRY_COUNT + 1):
+async def check_external(request_ctx, links):
+    """External lane: fresh cached results are reused, the rest checked with a short timeout."""
+    cache = StatusCache(EXTERNAL_CACHE_PATH, EXTERNAL_CACHE_TTL_SECONDS)
+    try:
+        results = []
+        pending = []
+        for link in links:
+            entry = cache.get(link)
+            if entry is None:
+                pending.append(link)
+            else:
+                print(f"Checked external (cached): {link} -> {entry.status}")
+                results.append((link, entry.status))
+        results += await check_urls(request_ctx, pending, concurrency=EXTERNAL_CONCURRENCY,
+                                    timeout_ms=EXTERNAL_TIMEOUT * 1000, cache=cache, retries=EXTERNAL_RETRY_COUNT,
+                                    on_result=lambda u, s: print(f"Checked external: {u} -> {s}"))
+        return results
+    finally:
+        cache.close()
+
+
+async def check_links(links, cookies=(), external=()):
+    """Check links concurrently; failed checks are re-queued with backoff rather than slept on.
+
+    ``cookies`` from the saved gate session are handed to the
+    SCAN_CHECK_BACKEND client.  ``external`` links run in their own
+    lane alongside.  Returns ``(internal_results, external_results)``.
+    """
+    cache = StatusCache()
+    async with async_playwright() as p:
+        request_ctx = await open_backend(p, cookies=cookies)
+        try:
+            return await asyncio.gather(
+                check_urls(request_ctx, links, concurrency=CHECK_CONCURRENCY,
+                           timeout_ms=REQUEST_TIMEOUT * 1000, cache=cache, retries=RETRY_COUNT,
+                           on_result=lambda u, s: print(f"Checked: {u} -> {s}")),
+                check_external(request_ctx, external),
+            )
+        finally:
+            await request_ctx.dispose()
+            cache.close()
+
+
+# password field of the gate - tried in order
+PWD_SELECTORS = [
+    'input[type="password"]',
+    'input[name="password"]',
+    'input#password',
+    'input[placeholder*="password"]',
+]
+# button that submits the password
+BTN_SELECTORS = [
+    'button:has-text("View")',
+    'button:has-text("VIEW")',
+    'button:has-text("Show")',
+    'input[type="submit"]',
+    'button[type="submit"]',
+]
+# content only visible past the gate
+SOFTWARE_LOCATORS = [
+    '#Software',
+    'text=Software',
+    'h1:has-text("Software")',
+    'h2:has-text("Software")',
+    'section:has-text("Software")',
+]
+
+
+def first_match(page, selectors):
+    """First element matching any of ``selectors``, or None."""
+    for sel in selectors:
         try:
-            # try HEAD first
-            try:
-                resp = request_ctx.head(url, timeout=REQUEST_TIMEOUT * 1000)
-                status = resp.status
-                # Some servers respond to HEAD with 405; treat by falling back
-                if status == 405 or status >= 400:
-                    resp = request_ctx.get(url, timeout=REQUEST_TIMEOUT * 1000)
-                    status = resp.status
-            except Exception:
-                # fallback to GET if HEAD failed
-                resp = request_ctx.get(url, timeout=REQUEST_TIMEOUT * 1000)
-                status = resp.status
-            return status
-        except Exception as e:
-            last_exc = e
-            time.sleep(0.5 * attempt)
-    raise last_exc
+            locator = page.locator(sel)
+            if locator.count() > 0:
+                return locator.nth(0)
+        except Exception:
+            continue
+    return None
+
+
+def gate_present(page) -> bool:
+    return first_match(page, PWD_SELECTORS) is not None
+
+
+def pass_password_gate(page):
+    pwd = first_match(page, PWD_SELECTORS)
+    assert pwd is not None, f"Password field not found with selectors: {PWD_SELECTORS}"
+    pwd.fill(PASSWORD)
+
+    btn = first_match(page, BTN_SELECTORS)
+    assert btn is not None, f"View button not found with selectors: {BTN_SELECTORS}"
+    btn.click()
+
+
+def open_gated_page(browser, session: SessionState):
+    """Open BASE_URL past the password gate and return ``(context, page)``.
+
+    The saved session is reused when it still gets past the gate.  Otherwise
+    it is invalidated, and one worker at a time logs in and saves a new one;
+    workers that waited for the lock pick up the state it saved.
+    """
+    for _ in range(3):
+        context = browser.new_context(storage_state=session.path if session.exists() else None)
+        page = context.new_page()
+        # skip fonts, media and third-party tags so networkidle settles quickly
+        CrawlProfile().attach(page)
+        page.goto(BASE_URL, wait_until='networkidle', timeout=30000)
+        if not gate_present(page):
+            return context, page
+        if session.exists():
+            print("Saved session no longer passes the gate; logging in again")
+            session.invalidate()
+            context.close()
+            continue
+        with session.bootstrap_lock():
+            if session.exists():
+                # another worker logged in while we waited
+                context.close()
+                continue
+            pass_password_gate(page)
+            page.wait_for_load_state('networkidle', timeout=30000)
+            session.save(context.storage_state())
+        return context, page
+    raise AssertionError("Could not get past the password gate")
 
 
 @pytest.mark.broken_links
@@ -60,66 +178,18 @@ def test_service_software_view_and_broken_links():
     visited = set()
     found_links = set()
     broken_links = []
+    broken_external = []
+    session = SessionState(SESSION_STATE_PATH)
 
     with sync_playwright() as p:
-        browser = p.chromium.launch(headless=True)
-        page = browser.new_page()
-        request_ctx = p.request.new_context()
+        browser = launch_or_connect(p.chromium, headless=True)
 
         try:
-            page.goto(BASE_URL, wait_until='networkidle', timeout=30000)
-
-            # find password field - try a set of selectors
-            pwd_selectors = [
-                'input[type="password"]',
-                'input[name="password"]',
-                'input#password',
-                'input[placeholder*="password"]',
-            ]
-            pwd = None
-            for sel in pwd_selectors:
-                try:
-                    locator = page.locator(sel)
-                    if locator.count() > 0:
-                        pwd = locator.nth(0)
-                        break
-                except Exception:
-                    continue
-
-            assert pwd is not None, f"Password field not found with selectors: {pwd_selectors}"
-            pwd.fill(PASSWORD)
-
-            # find and click view button
-            btn_selectors = [
-                'button:has-text("View")',
-                'button:has-text("VIEW")',
-                'button:has-text("Show")',
-                'input[type="submit"]',
-                'button[type="submit"]',
-            ]
-            btn = None
-            for sel in btn_selectors:
-                try:
-                    locator = page.locator(sel)
-                    if locator.count() > 0:
-                        btn = locator.nth(0)
-                        break
-                except Exception:
-                    continue
-
-            assert btn is not None, f"View button not found with selectors: {btn_selectors}"
-            btn.click()
+            context, page = open_gated_page(browser, session)
 
             # wait for software content
-            software_locators = [
-                '#Software',
-                'text=Software',
-                'h1:has-text("Software")',
-                'h2:has-text("Software")',
-                'section:has-text("Software")',
-            ]
             software_found = False
-            for sel in software_locators:
+            for sel in SOFTWARE_LOCATORS:
                 try:
                     locator = page.locator(sel)
                     if locator.count() > 0 and locator.nth(0).is_visible():
@@ -134,47 +204,56 @@ def test_service_software_view_and_broken_links():
 
             assert software_found, "Software content not visible after viewing"
 
-            # collect links
-            anchors = page.locator('a[href]')
-            for i in range(anchors.count()):
-                try:
-                    href = anchors.nth(i).get_attribute('href')
-                    full = normalize_url(page.url, href)
-                    if not full:
-                        continue
-                    if full in found_links:
-                        continue
-                    found_links.add(full)
-                except Exception:
+            # collect links (single evaluate instead of a round-trip per anchor)
+            for href in extract_page_urls(page)["links"]:
+                full = normalize_url(page.url, href)
+                if not full:
                     continue
-
-            # check same-origin and HTTP status
-            parsed_base = urlparse(BASE_URL)
-            for link in sorted(found_links):
-                purl = urlparse(link)
-                if purl.scheme not in ("http", "https"):
-                    continue
-                if purl.scheme != parsed_base.scheme or purl.netloc != parsed_base.netloc:
-                    # skip external
-                    continue
-                if is_allowlisted(link):
-                    print(f"Skipping allowlisted: {link}")
-                    continue
-                print(f"Checking: {link}")
-                try:
-                    status = http_status(request_ctx, link)
-                    if status == 404:
-                        broken_links.append((link, status))
-                except Exception as e:
-                    broken_links.append((link, str(e)))
+                found_links.add(full)
 
         finally:
-            request_ctx.dispose()
             browser.close()
 
+    # check same-origin links (and external ones when opted in); the sync driver is closed so the async checker can run
+    parsed_base = urlparse(BASE_URL)
+    targets = []
+    external = {}  # domain -> canonical URLs, so each outbound URL is requested once
+    for link in sorted(found_links):
+        purl = urlparse(link)
+        if purl.scheme not in ("http", "https"):
+            continue
+        if is_allowlisted(link):
+            print(f"Skipping allowlisted: {link}")
+            continue
+        if purl.scheme != parsed_base.scheme or purl.netloc != parsed_base.netloc:
+            if CHECK_EXTERNAL:
+                external.setdefault(purl.netloc, set()).add(canonicalize(link))
+            continue
+        targets.append(link)
+    external_targets = sorted(u for urls in external.values() for u in urls)
+    print(f"Checking {len(targets)} links"
+          + (f" and {len(external_targets)} external links on {len(external)} domains" if CHECK_EXTERNAL else ""))
+    internal_results, external_results = asyncio.run(check_links(targets, session.cookies(), external_targets))
+    for link, status in internal_results:
+        # only 404s and failed checks count as broken here
+        if status == 404 or not isinstance(status, int):
+            broken_links.append((link, status))
+    for link, status in external_results:
+        # third-party hosts time out and rate-limit; only gone pages count, other failures are reported
+        if status in (404, 410):
+            broken_external.append((link, status))
+        elif not isinstance(status, int) or status >= 400:
+            print(f"External link check inconclusive: {link} -> {status}")
+
     if broken_links:
         print("Broken links found:")
         for u, s in broken_links:
             print(f" - {u} -> {s}")
 
+    if broken_external:
+        print("Broken external links found:")
+        for u, s in broken_external:
+            print(f" - {u} -> {s}")
+
     assert not broken_links, f"Found {len(broken_links)} broken links"
+    assert not broken_external, f"Found {len(broken_external)} broken external links"
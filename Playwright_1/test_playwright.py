@@ -1,7 +1,14 @@
 from playwright.sync_api import sync_playwright
+import os
+import sys
+
+# Add the shared helpers to the path for imports
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), os.pardir, "common"))
+
+from browser_server import launch_or_connect
 
 with sync_playwright() as p:
-    browser = p.chromium.launch(headless=False)
+    browser = launch_or_connect(p.chromium, headless=False)
     page = browser.new_page()
     page.goto("https://playwright.dev", wait_until="domcontentloaded")
     print("Page title:", page.title())
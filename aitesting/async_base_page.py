@@ -0,0 +1,59 @@
+from playwright.async_api import Page, expect
+
+from base_page import DEFAULT_EXPECT_TIMEOUT
+
+
+class AsyncBasePage:
+    """Async-API counterpart of BasePage, with the same method surface."""
+
+    def __init__(self, page: Page):
+        self.page = page
+
+    async def navigate(self, url: str):
+        """Navigate to a URL."""
+        await self.page.goto(url)
+
+    async def click(self, selector: str, timeout: int = 30000):
+        """Click on an element."""
+        await self.page.click(selector, timeout=timeout)
+
+    async def fill(self, selector: str, text: str, timeout: int = 30000):
+        """Fill text in an input field."""
+        await self.page.fill(selector, text, timeout=timeout)
+
+    async def wait_for_selector(self, selector: str, timeout: int = 30000):
+        """Wait for an element to appear."""
+        await self.page.wait_for_selector(selector, timeout=timeout)
+
+    async def is_visible(self, selector: str, timeout: int = 5000) -> bool:
+        """Wait up to ``timeout`` ms for an element to appear; prefer is_visible_now or expect_*."""
+        try:
+            await self.page.wait_for_selector(selector, timeout=timeout)
+            return True
+        except Exception:
+            return False
+
+    async def is_visible_now(self, selector: str) -> bool:
+        """Check visibility right now, without waiting (cheap negative checks)."""
+        return await self.page.locator(selector).first.is_visible()
+
+    async def expect_visible(self, selector: str, timeout: int = DEFAULT_EXPECT_TIMEOUT):
+        """Assert an element becomes visible, returning as soon as it does."""
+        await expect(self.page.locator(selector).first).to_be_visible(timeout=timeout)
+
+    async def expect_hidden(self, selector: str, timeout: int = DEFAULT_EXPECT_TIMEOUT):
+        """Assert an element becomes hidden or detached, returning as soon as it does."""
+        await expect(self.page.locator(selector).first).to_be_hidden(timeout=timeout)
+
+    def expect_response(self, url_part: str, method: str = None, timeout: int = DEFAULT_EXPECT_TIMEOUT):
+        """Async context manager waiting for a response whose URL contains ``url_part``; await ``.value``."""
+        return self.page.expect_response(
+            lambda r: url_part in r.url and (method is None or r.request.method == method), timeout=timeout)
+
+    async def get_text(self, selector: str) -> str:
+        """Get text content of an element."""
+        return await self.page.inner_text(selector)
+
+    async def screenshot(self, path: str):
+        """Take a screenshot."""
+        await self.page.screenshot(path=path)
@@ -0,0 +1,74 @@
+from playwright.async_api import Page
+from async_base_page import AsyncBasePage
+from login_page import LoginPage
+
+class AsyncLoginPage(AsyncBasePage):
+    """Async-API Page Object for DemoBlaze Login functionality (same locators as LoginPage)."""
+
+    # Locators
+    LOGIN_LINK = LoginPage.LOGIN_LINK
+    USERNAME_FIELD = LoginPage.USERNAME_FIELD
+    PASSWORD_FIELD = LoginPage.PASSWORD_FIELD
+    LOGIN_BUTTON = LoginPage.LOGIN_BUTTON
+    LOGOUT_LINK = LoginPage.LOGOUT_LINK
+    WELCOME_TEXT = LoginPage.WELCOME_TEXT
+    LOGIN_MODAL = LoginPage.LOGIN_MODAL
+    LOGIN_API = LoginPage.LOGIN_API
+
+    def __init__(self, page: Page):
+        super().__init__(page)
+
+    async def click_login_link(self):
+        """Click on the 'Log in' link and wait for the login modal to finish opening."""
+        await self.click(self.LOGIN_LINK)
+        await self.wait_for_modal_open()
+
+    async def wait_for_modal_open(self):
+        """Wait until the login modal and its username field are visible."""
+        await self.expect_visible(self.LOGIN_MODAL)
+        await self.expect_visible(self.USERNAME_FIELD)
+
+    async def wait_for_modal_closed(self):
+        """Wait until the login modal is hidden again."""
+        await self.expect_hidden(self.LOGIN_MODAL)
+
+    async def enter_username(self, username: str):
+        """Enter username in the username field."""
+        await self.fill(self.USERNAME_FIELD, username)
+
+    async def enter_password(self, password: str):
+        """Enter password in the password field."""
+        await self.fill(self.PASSWORD_FIELD, password)
+
+    async def click_login_button(self):
+        """Click on the 'Log in' button and wait for the login API call; returns its response."""
+        async with self.expect_response(self.LOGIN_API, method="POST") as response:
+            await self.click(self.LOGIN_BUTTON)
+        return await response.value
+
+    async def wait_for_logged_in(self):
+        """Wait until the page shows the logged-in navigation."""
+        await self.wait_for_modal_closed()
+        await self.expect_visible(self.LOGOUT_LINK)
+        await self.expect_visible(self.WELCOME_TEXT)
+
+    async def wait_for_logged_out(self):
+        """Wait until the page shows the 'Log in' link again."""
+        await self.expect_visible(self.LOGIN_LINK)
+        await self.expect_hidden(self.LOGOUT_LINK)
+
+    async def is_logout_link_visible(self) -> bool:
+        """Verify that the 'Log out' link is visible."""
+        return await self.is_visible_now(self.LOGOUT_LINK)
+
+    async def get_welcome_text(self) -> str:
+        """Get the welcome text displayed at the top right."""
+        return await self.get_text(self.WELCOME_TEXT)
+
+    async def click_logout_link(self):
+        """Click on the 'Log out' link."""
+        await self.click(self.LOGOUT_LINK)
+
+    async def is_login_link_visible(self) -> bool:
+        """Verify that the 'Log in' link is visible."""
+        return await self.is_visible_now(self.LOGIN_LINK)
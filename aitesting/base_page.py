@@ -1,4 +1,7 @@
-from playwright.sync_api import Page
+from playwright.sync_api import Page, expect
+
+DEFAULT_EXPECT_TIMEOUT = 10000  # ms; expect_* poll until the condition holds or this passes
+
 
 class BasePage:
     """Base page object class for common page operations."""
@@ -22,14 +25,31 @@ class BasePage:
         """Wait for an element to appear."""
         self.page.wait_for_selector(selector, timeout=timeout)
 
-    def is_visible(self, selector: str) -> bool:
-        """Check if an element is visible."""
+    def is_visible(self, selector: str, timeout: int = 5000) -> bool:
+        """Wait up to ``timeout`` ms for an element to appear; prefer is_visible_now or expect_*."""
         try:
-            self.page.wait_for_selector(selector, timeout=5000)
+            self.page.wait_for_selector(selector, timeout=timeout)
             return True
         except Exception:
             return False
 
+    def is_visible_now(self, selector: str) -> bool:
+        """Check visibility right now, without waiting (cheap negative checks)."""
+        return self.page.locator(selector).first.is_visible()
+
+    def expect_visible(self, selector: str, timeout: int = DEFAULT_EXPECT_TIMEOUT):
+        """Assert an element becomes visible, returning as soon as it does."""
+        expect(self.page.locator(selector).first).to_be_visible(timeout=timeout)
+
+    def expect_hidden(self, selector: str, timeout: int = DEFAULT_EXPECT_TIMEOUT):
+        """Assert an element becomes hidden or detached, returning as soon as it does."""
+        expect(self.page.locator(selector).first).to_be_hidden(timeout=timeout)
+
+    def expect_response(self, url_part: str, method: str = None, timeout: int = DEFAULT_EXPECT_TIMEOUT):
+        """Context manager waiting for a response whose URL contains ``url_part``; ``.value`` holds it."""
+        return self.page.expect_response(
+            lambda r: url_part in r.url and (method is None or r.request.method == method), timeout=timeout)
+
     def get_text(self, selector: str) -> str:
         """Get text content of an element."""
         return self.page.inner_text(selector)
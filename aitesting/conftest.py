@@ -0,0 +1,191 @@
+import pytest
+from playwright.sync_api import sync_playwright
+import base64
+import json
+import re
+import sys
+import os
+
+# Add the aitesting directory and the shared helpers to the path for imports
+sys.path.insert(0, os.path.dirname(__file__))
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), os.pardir, "common"))
+
+from browser_server import launch_or_connect
+
+CONTEXT_POOL_SIZE = 2  # contexts created up front per worker
+CONTEXT_MAX_USES = 20  # a context is replaced after this many tests
+
+RESET_STORAGE_JS = "() => { try { localStorage.clear(); sessionStorage.clear(); } catch (e) {} }"
+
+# HAR record/replay: one HAR per test under HAR_DIR, covering only the site under test
+HAR_DIR = os.path.join(os.path.dirname(__file__), "hars")
+HAR_URL_FILTER = re.compile(r"^https?://([^/]+\.)?demoblaze\.com/")
+# API calls whose JSON bodies carry per-run tokens, so they are replayed by URL and method only
+HAR_API_CALLS = re.compile(r"^https://api\.demoblaze\.com/(login|check)$")
+# hop-by-hop and encoding headers that must not be replayed with a decoded body
+HAR_SKIP_HEADERS = {"content-length", "content-encoding", "transfer-encoding", "connection"}
+
+
+def pytest_addoption(parser):
+    group = parser.getgroup("aitesting")
+    group.addoption("--har-mode", choices=("live", "record", "replay"), default="live",
+                    help="live: use the real site (default); record: save a HAR per test; "
+                         "replay: serve requests from the saved HARs, offline")
+    group.addoption("--har-dir", default=HAR_DIR, help="Directory for the per-test HAR files")
+    try:
+        group.addoption("--headed", action="store_true", dest="headed", default=True,
+                        help="Run the browser with a visible window (default)")
+        group.addoption("--headless", action="store_false", dest="headed",
+                        help="Run the browser without a window")
+    except ValueError:
+        # pytest-playwright already defines --headed; its option is used instead
+        pass
+
+
+class ContextPool:
+    """Pre-warmed BrowserContexts handed out one per test and reset on return.
+
+    Resetting clears cookies, permissions and the storage of every open page,
+    and closes all pages but a fresh one, which is much cheaper than a new
+    context.  A context that fails to reset, or has served ``max_uses`` tests,
+    is closed and replaced.
+    """
+
+    def __init__(self, browser, size: int = CONTEXT_POOL_SIZE, max_uses: int = CONTEXT_MAX_USES):
+        self.browser = browser
+        self.max_uses = max_uses
+        self._uses = {}
+        self._idle = [self._new_context() for _ in range(size)]
+
+    def _new_context(self):
+        context = self.browser.new_context()
+        context.new_page()  # warm up the renderer before the first test needs it
+        self._uses[context] = 0
+        return context
+
+    def acquire(self):
+        context = self._idle.pop() if self._idle else self._new_context()
+        self._uses[context] += 1
+        return context
+
+    def release(self, context):
+        try:
+            if self._uses[context] >= self.max_uses:
+                raise RuntimeError("context reached its use limit")
+            for page in context.pages:
+                page.evaluate(RESET_STORAGE_JS)
+            context.clear_cookies()
+            context.clear_permissions()
+            fresh = context.new_page()
+            for page in context.pages:
+                if page is not fresh:
+                    page.close()
+            self._idle.append(context)
+        except Exception:
+            self._discard(context)
+            self._idle.append(self._new_context())
+
+    def _discard(self, context):
+        self._uses.pop(context, None)
+        try:
+            context.close()
+        except Exception:
+            pass
+
+    def close(self):
+        for context in list(self._uses):
+            self._discard(context)
+        self._idle = []
+
+
+def replay_api_calls(context, har_path: str):
+    """Serve the login/check API calls from a HAR, matched on URL and method only.
+
+    route_from_har also compares POST bodies, which for these calls contain a
+    token that differs from run to run; the first recorded answer per endpoint
+    is replayed instead.
+    """
+    with open(har_path, encoding="utf-8") as fh:
+        entries = json.load(fh)["log"]["entries"]
+    recorded = {}
+    for entry in entries:
+        match = HAR_API_CALLS.match(entry["request"]["url"])
+        if match and entry["request"]["method"] == "POST":
+            recorded.setdefault(match.group(1), entry["response"])
+
+    def handle(route):
+        response = recorded.get(HAR_API_CALLS.match(route.request.url).group(1))
+        if response is None or route.request.method != "POST":
+            route.fallback()
+            return
+        content = response["content"]
+        text = content.get("text", "")
+        body = base64.b64decode(text) if content.get("encoding") == "base64" else text.encode("utf-8")
+        headers = {h["name"]: h["value"] for h in response["headers"]
+                   if h["name"].lower() not in HAR_SKIP_HEADERS}
+        route.fulfill(status=response["status"], headers=headers, body=body)
+
+    context.route(HAR_API_CALLS, handle)
+
+
+def har_context(browser, mode: str, har_path: str):
+    """A new context that records into ``har_path`` or replays from it."""
+    if mode == "record":
+        os.makedirs(os.path.dirname(har_path), exist_ok=True)
+        # the HAR is written when the context closes
+        return browser.new_context(record_har_path=har_path, record_har_content="embed",
+                                   record_har_url_filter=HAR_URL_FILTER)
+    if not os.path.exists(har_path):
+        pytest.skip(f"No HAR recorded at {har_path}; run once with --har-mode=record")
+    context = browser.new_context(service_workers="block")
+    # routes are tried newest first: API calls, then the HAR, then abort (nothing reaches the network)
+    context.route("**/*", lambda route: route.abort())
+    context.route_from_har(har_path, url=HAR_URL_FILTER, not_found="abort")
+    replay_api_calls(context, har_path)
+    return context
+
+
+@pytest.fixture(scope="session")
+def browser(pytestconfig):
+    """One browser per test session; under pytest-xdist, one per worker process.
+
+    With common/browser_server.py running, every session connects to that
+    browser instead of launching one.
+    """
+    with sync_playwright() as p:
+        browser = launch_or_connect(p.chromium, headless=not pytestconfig.getoption("headed"))
+        yield browser
+        browser.close()
+
+
+@pytest.fixture(scope="session")
+def context_pool(browser):
+    pool = ContextPool(browser)
+    yield pool
+    pool.close()
+
+
+@pytest.fixture
+def context(request, browser, pytestconfig):
+    """A clean BrowserContext for the test.
+
+    Live runs borrow one from the pool; ``--har-mode=record|replay`` uses a
+    dedicated context recording to or replaying from the test's HAR file.
+    """
+    mode = pytestconfig.getoption("har_mode")
+    if mode == "live":
+        context_pool = request.getfixturevalue("context_pool")
+        context = context_pool.acquire()
+        yield context
+        context_pool.release(context)
+        return
+    har_name = f"{request.node.module.__name__}.{request.node.name}.har"
+    context = har_context(browser, mode, os.path.join(pytestconfig.getoption("har_dir"), har_name))
+    yield context
+    context.close()
+
+
+@pytest.fixture
+def page(context):
+    """The context's ready page."""
+    return context.pages[0] if context.pages else context.new_page()
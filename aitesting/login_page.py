@@ -11,13 +11,25 @@ class LoginPage(BasePage):
     LOGIN_BUTTON = "button[onclick='logIn()']"
     LOGOUT_LINK = "a[onclick='logOut()']"
     WELCOME_TEXT = "a#nameofuser"
+    LOGIN_MODAL = "#logInModal"
+    LOGIN_API = "api.demoblaze.com/login"
 
     def __init__(self, page: Page):
         super().__init__(page)
 
     def click_login_link(self):
-        """Click on the 'Log in' link in the top navigation bar."""
+        """Click on the 'Log in' link and wait for the login modal to finish opening."""
         self.click(self.LOGIN_LINK)
+        self.wait_for_modal_open()
+
+    def wait_for_modal_open(self):
+        """Wait until the login modal and its username field are visible."""
+        self.expect_visible(self.LOGIN_MODAL)
+        self.expect_visible(self.USERNAME_FIELD)
+
+    def wait_for_modal_closed(self):
+        """Wait until the login modal is hidden again."""
+        self.expect_hidden(self.LOGIN_MODAL)
 
     def enter_username(self, username: str):
         """Enter username in the username field."""
@@ -28,12 +40,25 @@ class LoginPage(BasePage):
         self.fill(self.PASSWORD_FIELD, password)
 
     def click_login_button(self):
-        """Click on the 'Log in' button."""
-        self.click(self.LOGIN_BUTTON)
+        """Click on the 'Log in' button and wait for the login API call; returns its response."""
+        with self.expect_response(self.LOGIN_API, method="POST") as response:
+            self.click(self.LOGIN_BUTTON)
+        return response.value
+
+    def wait_for_logged_in(self):
+        """Wait until the page shows the logged-in navigation."""
+        self.wait_for_modal_closed()
+        self.expect_visible(self.LOGOUT_LINK)
+        self.expect_visible(self.WELCOME_TEXT)
+
+    def wait_for_logged_out(self):
+        """Wait until the page shows the 'Log in' link again."""
+        self.expect_visible(self.LOGIN_LINK)
+        self.expect_hidden(self.LOGOUT_LINK)
 
     def is_logout_link_visible(self) -> bool:
         """Verify that the 'Log out' link is visible."""
-        return self.is_visible(self.LOGOUT_LINK)
+        return self.is_visible_now(self.LOGOUT_LINK)
 
     def get_welcome_text(self) -> str:
         """Get the welcome text displayed at the top right."""
@@ -45,5 +70,5 @@ class LoginPage(BasePage):
 
     def is_login_link_visible(self) -> bool:
         """Verify that the 'Log in' link is visible."""
-        return self.is_visible(self.LOGIN_LINK)
+        return self.is_visible_now(self.LOGIN_LINK)
 
@@ -0,0 +1,91 @@
+import argparse
+import asyncio
+import os
+import sys
+import time
+from collections import namedtuple
+
+from playwright.async_api import async_playwright
+
+# Add the aitesting directory and the shared helpers to the path for imports
+sys.path.insert(0, os.path.dirname(__file__))
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), os.pardir, "common"))
+
+from async_login_page import AsyncLoginPage
+from browser_server import launch_or_connect_async
+
+BASE_URL = "https://demoblaze.com/"
+USERNAME = "pavanol"
+PASSWORD = "test@123"
+
+ScenarioResult = namedtuple("ScenarioResult", "index ok elapsed_ms error")
+
+
+async def login_logout(page, username: str = USERNAME, password: str = PASSWORD):
+    """The DemoBlaze login/logout flow of test_demoblaze_login_logout, on an async page."""
+    login_page = AsyncLoginPage(page)
+    await login_page.navigate(BASE_URL)
+    await login_page.click_login_link()
+    await login_page.enter_username(username)
+    await login_page.enter_password(password)
+    response = await login_page.click_login_button()
+    assert response.ok, f"Login API returned HTTP {response.status}"
+    await login_page.wait_for_logged_in()
+    welcome_text = await login_page.get_welcome_text()
+    assert f"Welcome {username}" in welcome_text, f"Expected 'Welcome {username}' but got '{welcome_text}'"
+    await login_page.click_logout_link()
+    await login_page.wait_for_logged_out()
+
+
+async def run_scenario(browser, index: int, slots: asyncio.Semaphore) -> ScenarioResult:
+    """Run one login/logout in its own BrowserContext, so sessions never share cookies."""
+    async with slots:
+        started = time.perf_counter()
+        context = await browser.new_context()
+        try:
+            await login_logout(await context.new_page())
+            error = None
+        except Exception as e:
+            error = f"{type(e).__name__}: {e}".splitlines()[0]
+        finally:
+            await context.close()
+        elapsed_ms = round((time.perf_counter() - started) * 1000)
+        return ScenarioResult(index, error is None, elapsed_ms, error)
+
+
+async def run_scenarios(count: int, concurrency: int, headless: bool = True) -> list:
+    """Run ``count`` login/logout scenarios, at most ``concurrency`` at once, in one event loop."""
+    slots = asyncio.Semaphore(concurrency)
+    async with async_playwright() as p:
+        browser = await launch_or_connect_async(p.chromium, headless=headless)
+        try:
+            return await asyncio.gather(*(run_scenario(browser, i, slots) for i in range(count)))
+        finally:
+            await browser.close()
+
+
+def summarize(results) -> str:
+    """One-line health summary: pass count and latency percentiles."""
+    times = sorted(r.elapsed_ms for r in results if r.ok)
+    passed = len(times)
+    if not times:
+        return f"0/{len(results)} passed"
+    p50 = times[len(times) // 2]
+    p95 = times[min(len(times) - 1, int(len(times) * 0.95))]
+    return f"{passed}/{len(results)} passed; p50 {p50} ms, p95 {p95} ms, max {times[-1]} ms"
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Run concurrent DemoBlaze login/logout scenarios")
+    parser.add_argument("-n", "--sessions", type=int, default=24, help="scenarios to run (default %(default)s)")
+    parser.add_argument("-c", "--concurrency", type=int, default=12,
+                        help="scenarios in flight at once (default %(default)s)")
+    parser.add_argument("--headed", action="store_true", help="show the browser window")
+    args = parser.parse_args()
+
+    results = asyncio.run(run_scenarios(args.sessions, args.concurrency, headless=not args.headed))
+    for r in results:
+        if not r.ok:
+            print(f"✗ Scenario {r.index} failed after {r.elapsed_ms} ms: {r.error}")
+    print(summarize(results))
+    sys.exit(0 if all(r.ok for r in results) else 1)
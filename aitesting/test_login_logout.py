@@ -1,30 +1,9 @@
 import pytest
-from playwright.sync_api import sync_playwright
-import sys
-import os
-
-# Add the aitesting directory to the path for imports
-sys.path.insert(0, os.path.dirname(__file__))
 
 from base_page import BasePage
 from login_page import LoginPage
 
-
-@pytest.fixture
-def browser():
-    """Create a browser instance for the test."""
-    with sync_playwright() as p:
-        browser = p.chromium.launch(headless=False)
-        yield browser
-        browser.close()
-
-
-@pytest.fixture
-def page(browser):
-    """Create a page instance for the test."""
-    page = browser.new_page()
-    yield page
-    page.close()
+# browser, context and page fixtures come from conftest.py (shared browser, pooled contexts)
 
 
 def test_demoblaze_login_logout(page):
@@ -52,8 +31,7 @@ def test_demoblaze_login_logout(page):
 
     # Step 2: Click on Login link
     print("✓ Step 2: Click on the 'Log in' link")
-    login_page.click_login_link()
-    page.wait_for_selector(LoginPage.USERNAME_FIELD, timeout=10000)
+    login_page.click_login_link()  # returns once the modal is open
 
     # Step 3: Enter username
     print("✓ Step 3: Enter username 'pavanol'")
@@ -65,8 +43,9 @@ def test_demoblaze_login_logout(page):
 
     # Step 5: Click Log in button
     print("✓ Step 5: Click the 'Log in' button")
-    login_page.click_login_button()
-    page.wait_for_selector(LoginPage.LOGOUT_LINK, timeout=10000)
+    response = login_page.click_login_button()  # waits for the login API call
+    assert response.ok, f"Login API returned HTTP {response.status}"
+    login_page.wait_for_logged_in()
 
     # Step 6: Verify logout link is visible
     print("✓ Step 6: Verify that the 'Log out' link is visible")
@@ -81,7 +60,7 @@ def test_demoblaze_login_logout(page):
     # Step 8: Click Log out link
     print("✓ Step 8: Click the 'Log out' link")
     login_page.click_logout_link()
-    page.wait_for_selector(LoginPage.LOGIN_LINK, timeout=10000)
+    login_page.wait_for_logged_out()
 
     # Step 9: Verify login link is visible again
     print("✓ Step 9: Verify that the 'Log in' link is visible again after logout")
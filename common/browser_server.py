@@ -0,0 +1,88 @@
+# Opt-in long-lived browser shared by every entry point.
+#
+#   python common/browser_server.py [--headless] [--port 9222]
+#
+# starts Chromium once and writes its endpoint to ENDPOINT_FILE; the scanners
+# and test fixtures then connect to it instead of launching their own browser,
+# and fall back to a normal launch when no server is running.  Sharded scan
+# workers (SCAN_SHARDS > 1) still launch one browser each.  Python
+# Playwright has no BrowserType.launch_server, so the server exposes the
+# Chrome DevTools Protocol and clients use connect_over_cdp (Chromium only).
+import argparse
+import json
+import os
+import sys
+import time
+
+from status_cache import CACHE_DIR
+
+ENDPOINT_FILE = os.environ.get("PW_BROWSER_ENDPOINT_FILE", os.path.join(CACHE_DIR, "browser-endpoint.json"))
+DEFAULT_PORT = 9222
+CONNECT_TIMEOUT_MS = 5000
+
+
+def read_endpoint():
+    """CDP endpoint of the running browser server, or None."""
+    try:
+        with open(ENDPOINT_FILE, encoding="utf-8") as fh:
+            return json.load(fh)["endpoint"]
+    except (OSError, ValueError, KeyError):
+        return None
+
+
+def launch_or_connect(browser_type, **launch_kwargs):
+    """Connect to the browser server if one is running, else ``browser_type.launch(**launch_kwargs)``.
+
+    A connected browser keeps the server's headless mode; ``close()`` only
+    disconnects and closes the contexts this client created.
+    """
+    endpoint = read_endpoint()
+    if endpoint and browser_type.name == "chromium":
+        try:
+            return browser_type.connect_over_cdp(endpoint, timeout=CONNECT_TIMEOUT_MS)
+        except Exception as e:
+            print(f"  ⚠️ Browser server at {endpoint} unavailable, launching instead: {e}")
+    return browser_type.launch(**launch_kwargs)
+
+
+async def launch_or_connect_async(browser_type, **launch_kwargs):
+    """Async-API form of launch_or_connect."""
+    endpoint = read_endpoint()
+    if endpoint and browser_type.name == "chromium":
+        try:
+            return await browser_type.connect_over_cdp(endpoint, timeout=CONNECT_TIMEOUT_MS)
+        except Exception as e:
+            print(f"  ⚠️ Browser server at {endpoint} unavailable, launching instead: {e}")
+    return await browser_type.launch(**launch_kwargs)
+
+
+def serve(headless: bool, port: int):
+    from playwright.sync_api import sync_playwright
+
+    endpoint = f"http://127.0.0.1:{port}"
+    with sync_playwright() as p:
+        browser = p.chromium.launch(headless=headless, args=[f"--remote-debugging-port={port}"])
+        os.makedirs(os.path.dirname(os.path.abspath(ENDPOINT_FILE)), exist_ok=True)
+        with open(ENDPOINT_FILE, "w", encoding="utf-8") as fh:
+            json.dump({"endpoint": endpoint, "pid": os.getpid(), "headless": headless}, fh)
+        print(f"Browser server listening on {endpoint} (endpoint written to {ENDPOINT_FILE}); Ctrl+C to stop")
+        try:
+            while True:
+                time.sleep(1)
+        except KeyboardInterrupt:
+            pass
+        finally:
+            # a stale file would only cost clients a failed connect, but tidy up anyway
+            try:
+                os.remove(ENDPOINT_FILE)
+            except FileNotFoundError:
+                pass
+            browser.close()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Run one shared Chromium for the scanners and tests")
+    parser.add_argument("--headless", action="store_true", help="run without a window")
+    parser.add_argument("--port", type=int, default=DEFAULT_PORT, help="DevTools port (default %(default)s)")
+    args = parser.parse_args()
+    sys.exit(serve(args.headless, args.port))
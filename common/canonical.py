@@ -0,0 +1,106 @@
+import re
+from fnmatch import fnmatchcase
+from functools import lru_cache
+from urllib.parse import unquote_plus, urljoin, urlsplit, urlunsplit
+
+# Query parameters that never change the resource (glob patterns, matched case-insensitively)
+TRACKING_PARAMS = [
+    "utm_*",
+    "gclid",
+    "gbraid",
+    "wbraid",
+    "dclid",
+    "fbclid",
+    "msclkid",
+    "yclid",
+    "igshid",
+    "mc_cid",
+    "mc_eid",
+    "_ga",
+    "_gl",
+    "_hsenc",
+    "_hsmi",
+    "hsctatracking",
+]
+# Links with these prefixes are not fetchable resources
+SKIP_PREFIXES = ("javascript:", "mailto:", "tel:", "data:")
+DEFAULT_PORTS = {"http": 80, "https": 443}
+
+
+def configure(tracking_params):
+    """Replace the tracking-parameter patterns (clears the memoized results)."""
+    TRACKING_PARAMS[:] = list(tracking_params)
+    canonicalize.cache_clear()
+
+
+def _is_tracking(name: str) -> bool:
+    name = name.lower()
+    return any(fnmatchcase(name, pattern) for pattern in TRACKING_PARAMS)
+
+
+def _param_name(param: str) -> str:
+    return unquote_plus(param.partition("=")[0])
+
+
+def _remove_dot_segments(path: str) -> str:
+    # RFC 3986 section 5.2.4, on already split segments
+    output = []
+    for segment in path.split("/"):
+        if segment == "..":
+            if len(output) > 1:
+                output.pop()
+        elif segment != ".":
+            output.append(segment)
+    if path.endswith(("/.", "/..")):
+        output.append("")
+    return "/".join(output)
+
+
+@lru_cache(maxsize=65536)
+def canonicalize(url: str) -> str:
+    """Single spelling of a URL used for dedupe, cache keys and shard routing.
+
+    Lowercases scheme and host, drops default ports and fragments, collapses
+    duplicate slashes, resolves dot segments, removes tracking parameters and
+    sorts the remaining query parameters by name.  The result is also the URL
+    that gets requested, so every kept parameter retains its original
+    spelling (bare keys, percent-encoding) and repeated parameters keep their
+    relative order.  Non-HTTP URLs are returned as-is.
+    """
+    try:
+        parts = urlsplit(url.strip())
+    except ValueError:
+        return url
+    scheme = parts.scheme.lower()
+    if scheme not in DEFAULT_PORTS:
+        return url
+    host = (parts.hostname or "").lower()
+    if ":" in host:
+        host = f"[{host}]"  # IPv6 literal
+    try:
+        port = parts.port
+    except ValueError:
+        port = None
+    netloc = host
+    if parts.username:
+        userinfo = parts.username + (f":{parts.password}" if parts.password else "")
+        netloc = f"{userinfo}@{host}"
+    if port and port != DEFAULT_PORTS[scheme]:
+        netloc += f":{port}"
+    path = _remove_dot_segments(re.sub(r"/{2,}", "/", parts.path)) or "/"
+    params = [p for p in parts.query.split("&") if p and not _is_tracking(_param_name(p))]
+    # a stable sort: "?a=2&a=1" must not become "?a=1&a=2"
+    query = "&".join(sorted(params, key=_param_name))
+    return urlunsplit((scheme, netloc, path, query, ""))
+
+
+def normalize_url(base, link):
+    """Resolve an href/src against ``base`` and canonicalize it; None for non-resources."""
+    if not link:
+        return None
+    link = link.strip()
+    if link.lower().startswith(SKIP_PREFIXES):
+        return None
+    if link.startswith("#"):
+        return None
+    return canonicalize(urljoin(base, link))
@@ -0,0 +1,223 @@
+import asyncio
+
+from politeness import HostScheduler, is_host_failure
+from probe import Prober, probe_status, range_headers, sniff_image
+
+REQUEST_TIMEOUT_MS = 10000
+RETRY_COUNT = 3
+CHECK_CONCURRENCY = 16  # max in-flight status checks
+CHECK_QUEUE_SIZE = 256  # URLs waiting in a CheckPipeline before producers block
+
+
+def is_broken_status(status) -> bool:
+    """Return True for HTTP error codes and for error strings from failed checks."""
+    if isinstance(status, int):
+        return status >= 400
+    return True
+
+
+async def safe_request(request_ctx, method, url, timeout_ms: int = REQUEST_TIMEOUT_MS,
+                       retries: int = RETRY_COUNT, headers=None):
+    """Issue a HEAD or GET through an async APIRequestContext, retrying on errors.
+
+    Callers that schedule their own retries (CheckPipeline) pass ``retries=1``.
+    """
+    last_exc = None
+    for attempt in range(1, retries + 1):
+        try:
+            if method.lower() == "head":
+                # Some servers don't support HEAD; fetch_status falls back to a ranged GET
+                return await request_ctx.head(url, timeout=timeout_ms, headers=headers)
+            return await request_ctx.get(url, timeout=timeout_ms, headers=headers)
+        except Exception as e:
+            last_exc = e
+            if attempt < retries:
+                await asyncio.sleep(HostScheduler.backoff(attempt))
+    raise last_exc
+
+
+async def fetch_status(request_ctx, url, timeout_ms: int = REQUEST_TIMEOUT_MS, cache=None,
+                       scheduler=None, retries: int = RETRY_COUNT, prober=None, kind: str = "link"):
+    """Return the HTTP status for a URL using the cheapest request that answers it.
+
+    Links get a HEAD while their host's HEAD answers hold up (see
+    probe.Prober), otherwise a ``Range`` GET for the first bytes.  Images
+    always get the ranged GET, and a 2xx whose bytes are not an image is
+    reported as an ``invalid-image`` error string.  With a StatusCache,
+    previously healthy URLs are revalidated conditionally and a 304 answer
+    returns the cached status.  With a HostScheduler, every request first
+    takes a token from the host's bucket.
+    """
+    prober = prober or Prober()
+    headers = cache.conditional_headers(url) if cache else {}
+
+    async def request(method, request_headers):
+        if scheduler:
+            await scheduler.acquire(url)
+        return await safe_request(request_ctx, method, url, timeout_ms, retries=retries, headers=request_headers)
+
+    resp = None
+    head_status = None
+    tried_head = kind != "image" and prober.head_usable(url)
+    if tried_head:
+        try:
+            resp = await request("head", headers)
+            head_status = resp.status
+        except Exception:
+            pass
+        # some servers respond to HEAD with 405 or errors; fall back to GET
+        if head_status is None or head_status >= 400:
+            resp = None
+        else:
+            prober.record_head(url, True)
+    if resp is None:
+        resp = await request("get", range_headers(headers))
+        if resp.status == 416:
+            # empty or range-averse resource: ask for it whole
+            resp = await request("get", headers)
+        if tried_head:
+            prober.record_head(url, head_status == probe_status(resp.status))
+    status = probe_status(resp.status)
+
+    if cache and status == 304:
+        cached = cache.revalidated(url)
+        if cached is not None:
+            return cached
+    if kind == "image" and 200 <= status < 300:
+        reason = sniff_image(resp.headers.get("content-type", ""), await resp.body())
+        if reason:
+            return f"invalid-image: {reason}"
+    if cache and status != 304:
+        cache.store(url, status, resp.headers)
+    return status
+
+
+class CheckPipeline:
+    """Checks URLs through a bounded queue while they are still being discovered.
+
+    Producers ``await submit(kind, url)``; a full queue makes them wait, which
+    keeps memory bounded.  Each ``(kind, url)`` pair is handled once.  A status
+    passed to ``submit`` is final and reported without a request; otherwise
+    ``lookup(url)`` may supply an already observed status before falling back
+    to an HTTP check.  ``on_result(kind, url, status)`` is called as each
+    result completes.  Use as ``async with CheckPipeline(...) as pipeline:``;
+    leaving the block waits for the queue to drain.
+
+    Requests are paced per host by a HostScheduler and shaped by a Prober
+    that learns which hosts answer HEAD reliably.  A failed or throttled
+    check is re-queued after a jittered backoff instead of holding a worker,
+    and URLs on a host whose circuit breaker is open are reported as
+    ``circuit-open`` without a request.  Content-validation failures such as
+    ``invalid-image`` are final and never count against the host.
+    """
+
+    def __init__(self, request_ctx, on_result, concurrency: int = CHECK_CONCURRENCY,
+                 maxsize: int = CHECK_QUEUE_SIZE, timeout_ms: int = REQUEST_TIMEOUT_MS,
+                 cache=None, lookup=None, scheduler=None, retries: int = RETRY_COUNT, prober=None):
+        self._request_ctx = request_ctx
+        self._on_result = on_result
+        self._concurrency = concurrency
+        self._timeout_ms = timeout_ms
+        self._cache = cache
+        self._lookup = lookup
+        self._scheduler = scheduler or HostScheduler()
+        self.prober = prober or Prober()
+        self._retries = retries
+        self._queue = asyncio.Queue(maxsize)
+        self._submitted = set()
+        self._workers = []
+        self._retry_tasks = set()
+        self.http_checks = 0
+        self.retries_scheduled = 0
+
+    def submitted(self, kind: str, url: str) -> bool:
+        return (kind, url) in self._submitted
+
+    async def submit(self, kind: str, url: str, status=None):
+        if (kind, url) in self._submitted:
+            return
+        self._submitted.add((kind, url))
+        if status is not None:
+            self._on_result(kind, url, status)
+            return
+        await self._queue.put((kind, url, 1))
+
+    async def _requeue_later(self, item, delay):
+        await asyncio.sleep(delay)
+        await self._queue.put(item)
+
+    def _retry_later(self, kind, url, attempt):
+        self.retries_scheduled += 1
+        task = asyncio.create_task(self._requeue_later((kind, url, attempt), self._scheduler.backoff(attempt)))
+        self._retry_tasks.add(task)
+        task.add_done_callback(self._retry_tasks.discard)
+
+    async def _check(self, kind, url, attempt):
+        status = self._lookup(url) if self._lookup else None
+        if isinstance(status, int):
+            return status
+        if not self._scheduler.allow(url):
+            return self._scheduler.circuit_open_status(url)
+        self.http_checks += 1
+        try:
+            status = await fetch_status(self._request_ctx, url, self._timeout_ms, cache=self._cache,
+                                        scheduler=self._scheduler, retries=1, prober=self.prober, kind=kind)
+        except Exception as e:
+            status = e
+        failed = is_host_failure(status)
+        self._scheduler.record(url, not failed)
+        if failed and attempt < self._retries:
+            self._retry_later(kind, url, attempt + 1)
+            return None
+        return str(status) if isinstance(status, Exception) else status
+
+    async def _worker(self):
+        while True:
+            kind, url, attempt = await self._queue.get()
+            try:
+                status = await self._check(kind, url, attempt)
+                if status is not None:
+                    self._on_result(kind, url, status)
+            finally:
+                self._queue.task_done()
+
+    async def __aenter__(self):
+        self._workers = [asyncio.create_task(self._worker()) for _ in range(max(1, self._concurrency))]
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        try:
+            if exc_type is None:
+                # a retry may re-enter the queue after it drained, so wait for both
+                while True:
+                    await self._queue.join()
+                    if not self._retry_tasks:
+                        break
+                    await asyncio.gather(*list(self._retry_tasks))
+        finally:
+            for task in self._workers + list(self._retry_tasks):
+                task.cancel()
+            await asyncio.gather(*self._workers, *self._retry_tasks, return_exceptions=True)
+
+
+async def check_urls(request_ctx, urls, concurrency: int = CHECK_CONCURRENCY,
+                     timeout_ms: int = REQUEST_TIMEOUT_MS, on_result=None, cache=None, scheduler=None,
+                     retries: int = RETRY_COUNT):
+    """Check many URLs in parallel and return ``(url, status)`` tuples in completion order.
+
+    ``status`` is the HTTP status code or an error string.  ``on_result(url,
+    status)`` is called with each tuple as soon as it is available.  This is
+    the batch form of CheckPipeline and shares its caching and politeness.
+    """
+    results = []
+
+    def collect(kind, url, status):
+        results.append((url, status))
+        if on_result:
+            on_result(url, status)
+
+    async with CheckPipeline(request_ctx, collect, concurrency=concurrency, timeout_ms=timeout_ms,
+                             cache=cache, scheduler=scheduler, retries=retries) as pipeline:
+        for url in urls:
+            await pipeline.submit("url", url)
+    return results
@@ -0,0 +1,78 @@
+from urllib.parse import urlparse
+
+# Resource types link discovery never needs
+BLOCKED_RESOURCE_TYPES = {"font", "media"}
+# Analytics, beacons and third-party tags that keep "networkidle" from settling
+BLOCKED_DOMAINS = [
+    "google-analytics.com",
+    "googletagmanager.com",
+    "doubleclick.net",
+    "googleadservices.com",
+    "connect.facebook.net",
+    "facebook.com",
+    "hotjar.com",
+    "clarity.ms",
+    "linkedin.com",
+    "licdn.com",
+    "hubspot.com",
+    "hs-analytics.net",
+    "hs-scripts.com",
+    "newrelic.com",
+    "nr-data.net",
+    "segment.io",
+    "youtube.com",
+    "vimeo.com",
+]
+
+
+def _host_matches(host: str, domains) -> bool:
+    return any(host == d or host.endswith("." + d) for d in domains)
+
+
+class CrawlProfile:
+    """Aborts requests that link discovery does not need and records what it blocked.
+
+    Attach it to discovery pages with ``page.route``.  ``blocked`` keeps every
+    aborted ``(url, resource_type)`` so blocked images can still be checked over
+    HTTP afterwards.
+    """
+
+    def __init__(self, resource_types=BLOCKED_RESOURCE_TYPES, domains=BLOCKED_DOMAINS):
+        self.resource_types = set(resource_types)
+        self.domains = list(domains)
+        self.blocked = []
+
+    def should_block(self, request) -> bool:
+        if request.resource_type == "document":
+            return False  # never block the navigation itself
+        if request.resource_type in self.resource_types:
+            return True
+        return _host_matches(urlparse(request.url).hostname or "", self.domains)
+
+    def attach(self, page):
+        """Install the blocking route on a sync-API page."""
+        def handle(route):
+            if self.should_block(route.request):
+                self.blocked.append((route.request.url, route.request.resource_type))
+                route.abort()
+            else:
+                route.continue_()
+        page.route("**/*", handle)
+
+    async def attach_async(self, page):
+        """Install the blocking route on an async-API page."""
+        async def handle(route):
+            if self.should_block(route.request):
+                self.blocked.append((route.request.url, route.request.resource_type))
+                await route.abort()
+            else:
+                await route.continue_()
+        await page.route("**/*", handle)
+
+    def blocked_urls(self, resource_type=None) -> set:
+        return {u for u, t in self.blocked if resource_type is None or t == resource_type}
+
+    def blocked_first_party_images(self, base_url: str) -> set:
+        """Images on the site's own host that were aborted and still need checking."""
+        host = urlparse(base_url).hostname
+        return {u for u in self.blocked_urls("image") if urlparse(u).hostname == host}
@@ -0,0 +1,165 @@
+import asyncio
+import re
+import time
+
+CRAWL_POOL_SIZE = 4  # pages crawling in parallel
+
+
+class RetryLater(Exception):
+    """Raised by a visit callback to put its URL back on the frontier after ``delay`` seconds."""
+
+    def __init__(self, delay: float):
+        super().__init__(f"retry in {delay:.1f}s")
+        self.delay = delay
+
+
+class PageBudget:
+    """Stops the crawl after a fixed number of pages."""
+
+    def __init__(self, max_pages: int):
+        self.max_pages = max_pages
+        self.taken = 0
+
+    def take(self):
+        self.taken += 1
+
+    def exhausted(self) -> bool:
+        return self.taken >= self.max_pages
+
+
+_DURATION_RE = re.compile(r"^\s*(?:(\d+(?:\.\d+)?)h)?\s*(?:(\d+(?:\.\d+)?)m)?\s*(?:(\d+(?:\.\d+)?)s?)?\s*$")
+
+
+def parse_duration(value) -> float:
+    """Seconds in a duration such as ``480``, ``"90s"``, ``"8m"`` or ``"1h30m"``."""
+    if isinstance(value, (int, float)):
+        return float(value)
+    m = _DURATION_RE.match(value or "")
+    if not m or not any(m.groups()):
+        raise ValueError(f"Invalid duration: {value!r}")
+    hours, minutes, seconds = (float(g) if g else 0.0 for g in m.groups())
+    return hours * 3600 + minutes * 60 + seconds
+
+
+class TimeBudget:
+    """Stops the crawl once a wall-clock deadline passes (optionally also after ``max_pages``).
+
+    The deadline is absolute wall-clock time, so the same budget can be handed
+    to shard processes; ``share_pages`` makes them count ``max_pages``
+    together.  Pages already in flight at the deadline are finished.
+    """
+
+    def __init__(self, seconds: float, max_pages: int = None):
+        self.seconds = seconds
+        self.deadline = time.time() + seconds
+        self.max_pages = max_pages
+        self._taken = None  # shared multiprocessing Value, once share_pages is called
+        self.taken = 0
+
+    def share_pages(self, taken):
+        """Count pages in ``taken``, a ``multiprocessing.Value`` shared by every shard."""
+        self._taken = taken
+
+    def take(self):
+        if self._taken is None:
+            self.taken += 1
+            return
+        with self._taken.get_lock():
+            self._taken.value += 1
+
+    def pages_taken(self) -> int:
+        return self.taken if self._taken is None else self._taken.value
+
+    def remaining(self) -> float:
+        return max(0.0, self.deadline - time.time())
+
+    def exhausted(self) -> bool:
+        if self.max_pages is not None and self.pages_taken() >= self.max_pages:
+            return True
+        return time.time() >= self.deadline
+
+
+async def crawl(browser, frontier, visit, budget, pool_size: int = CRAWL_POOL_SIZE,
+                setup_page=None) -> int:
+    """Drain ``frontier`` with a pool of pages working concurrently.
+
+    Each worker owns its own BrowserContext and page and awaits
+    ``visit(page, url)`` for every URL it takes; ``visit`` may push newly
+    discovered URLs back onto the frontier.  ``setup_page(page)``, if given, is
+    awaited once for each new worker page.  ``budget`` is a page count or an
+    object with ``take()``/``exhausted()``.  The crawl ends when the budget is
+    used up or the frontier is empty with no visit in flight (frontiers fed from
+    elsewhere can keep it alive through ``wait_for_remote``).  A visit that
+    raises RetryLater is re-queued after its delay without holding a worker or
+    spending more budget.  Returns the number of pages this crawl visited.
+    """
+    if isinstance(budget, int):
+        budget = PageBudget(budget)
+    cond = asyncio.Condition()
+    state = {"started": 0, "active": 0, "deferred": 0}
+    retrying = set()
+    retry_tasks = set()
+    wait_for_remote = getattr(frontier, "wait_for_remote", None)
+
+    async def has_work():
+        if len(frontier):
+            return True
+        # nothing queued and nothing in flight locally: wait for other producers, if any
+        return bool(wait_for_remote) and await wait_for_remote(budget.exhausted)
+
+    async def requeue_later(url, delay):
+        await asyncio.sleep(delay)
+        async with cond:
+            frontier.requeue(url)
+            retrying.add(url)
+            state["deferred"] -= 1
+            cond.notify_all()
+
+    async def worker():
+        context = await browser.new_context()
+        page = await context.new_page()
+        if setup_page:
+            await setup_page(page)
+        try:
+            while True:
+                async with cond:
+                    # wait while other workers may still discover new URLs
+                    while (not len(frontier) and (state["active"] or state["deferred"])
+                           and not budget.exhausted()):
+                        await cond.wait()
+                    if budget.exhausted() or not await has_work():
+                        cond.notify_all()
+                        return
+                    url = frontier.pop()
+                    if url in retrying:
+                        retrying.discard(url)
+                    else:
+                        budget.take()
+                        state["started"] += 1
+                    state["active"] += 1
+                retry = None
+                try:
+                    await visit(page, url)
+                except RetryLater as e:
+                    retry = e.delay
+                except Exception as e:
+                    print(f"  ⚠️ Crawl worker error on {url}: {e}")
+                finally:
+                    if retry is None:
+                        frontier.done(url)
+                    async with cond:
+                        state["active"] -= 1
+                        if retry is not None:
+                            state["deferred"] += 1
+                            task = asyncio.create_task(requeue_later(url, retry))
+                            retry_tasks.add(task)
+                            task.add_done_callback(retry_tasks.discard)
+                        cond.notify_all()
+        finally:
+            await context.close()
+
+    await asyncio.gather(*(worker() for _ in range(max(1, pool_size))))
+    # retries still waiting when the budget ran out are dropped
+    for task in list(retry_tasks):
+        task.cancel()
+    return state["started"]
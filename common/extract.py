@@ -0,0 +1,74 @@
+# Collects every link and image URL on a page in a single page.evaluate call,
+# instead of one get_attribute round-trip per element.  URLs come back already
+# resolved against document.baseURI; scheme filtering stays with normalize_url.
+# ``text`` is the page's visible text, capped, for near-duplicate fingerprints.
+TEXT_SKELETON_CHARS = 20000
+EXTRACT_URLS_JS = r"""
+() => {
+    const base = document.baseURI;
+    const links = new Set();
+    const images = new Set();
+
+    const resolve = (raw) => {
+        if (!raw) return null;
+        raw = raw.trim();
+        if (!raw || raw.startsWith('#')) return null;
+        try {
+            return new URL(raw, base).href;
+        } catch (e) {
+            return null;
+        }
+    };
+    const addImage = (raw) => {
+        const u = resolve(raw);
+        if (u) images.add(u);
+    };
+    const addSrcset = (value) => {
+        if (!value) return;
+        for (const candidate of value.split(',')) {
+            addImage(candidate.trim().split(/\s+/)[0]);
+        }
+    };
+
+    for (const a of document.querySelectorAll('a[href]')) {
+        const u = resolve(a.getAttribute('href'));
+        if (u) links.add(u);
+    }
+    for (const img of document.querySelectorAll('img')) {
+        addImage(img.getAttribute('src'));
+        addSrcset(img.getAttribute('srcset'));
+    }
+    for (const source of document.querySelectorAll('picture source')) {
+        addImage(source.getAttribute('src'));
+        addSrcset(source.getAttribute('srcset'));
+    }
+    // lazy-loading libraries keep the real URL in data-* attributes
+    for (const el of document.querySelectorAll('[data-src], [data-lazy], [data-lazy-src], [data-srcset]')) {
+        addImage(el.getAttribute('data-src'));
+        addImage(el.getAttribute('data-lazy'));
+        addImage(el.getAttribute('data-lazy-src'));
+        addSrcset(el.getAttribute('data-srcset'));
+    }
+    // computed background-image values are already absolute url("...") lists
+    for (const el of document.querySelectorAll('*')) {
+        const bg = getComputedStyle(el).backgroundImage;
+        if (!bg || bg === 'none') continue;
+        for (const m of bg.matchAll(/url\(\s*(['"]?)(.*?)\1\s*\)/g)) {
+            addImage(m[2]);
+        }
+    }
+
+    const text = document.body ? document.body.innerText.slice(0, %d) : '';
+    return {links: [...links], images: [...images], text};
+}
+""" % TEXT_SKELETON_CHARS
+
+
+def extract_page_urls(page) -> dict:
+    """Return ``{"links": [...], "images": [...], "text": str}`` for a sync-API page."""
+    return page.evaluate(EXTRACT_URLS_JS)
+
+
+async def extract_page_urls_async(page) -> dict:
+    """Return ``{"links": [...], "images": [...], "text": str}`` for an async-API page."""
+    return await page.evaluate(EXTRACT_URLS_JS)
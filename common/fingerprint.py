@@ -0,0 +1,90 @@
+import hashlib
+import re
+from urllib.parse import parse_qsl, urlsplit
+
+SIMHASH_BITS = 64
+NEAR_DUP_DISTANCE = 3  # max differing bits for two pages to count as near-duplicates
+PRUNE_AFTER = 3  # near-duplicates of one URL pattern before its pages stop feeding the frontier
+MAX_FINGERPRINTS_PER_PATTERN = 50
+SKELETON_SHINGLE = 3  # words per text shingle
+
+_DIGITS_RE = re.compile(r"\d+")
+_WORD_RE = re.compile(r"\w+")
+
+
+def _hash64(feature: str) -> int:
+    return int.from_bytes(hashlib.blake2b(feature.encode("utf-8"), digest_size=8).digest(), "big")
+
+
+def simhash(features) -> int:
+    """64-bit simhash of a collection of string features."""
+    weights = [0] * SIMHASH_BITS
+    for feature in features:
+        h = _hash64(feature)
+        for bit in range(SIMHASH_BITS):
+            weights[bit] += 1 if h >> bit & 1 else -1
+    return sum(1 << bit for bit, w in enumerate(weights) if w > 0)
+
+
+def hamming(a: int, b: int) -> int:
+    return bin(a ^ b).count("1")
+
+
+def page_features(links, text: str) -> list:
+    """Features for a page: its outgoing links plus shingles of its digit-masked text."""
+    features = [f"link:{u}" for u in links]
+    words = _WORD_RE.findall(_DIGITS_RE.sub("0", (text or "").lower()))
+    n = SKELETON_SHINGLE
+    features.extend("text:" + " ".join(words[i:i + n]) for i in range(max(1, len(words) - n + 1)))
+    return features
+
+
+def url_pattern(url: str) -> str:
+    """Shape of a URL: numbers masked in the path, query reduced to its sorted keys.
+
+    ``/events/2024/05?page=3&sort=asc`` and ``/events/2023/11?sort=desc&page=9``
+    share the pattern ``/events/{n}/{n}?page&sort``.
+    """
+    parts = urlsplit(url)
+    path = _DIGITS_RE.sub("{n}", parts.path)
+    keys = sorted({k for k, _ in parse_qsl(parts.query, keep_blank_values=True)})
+    return path + ("?" + "&".join(keys) if keys else "")
+
+
+class NearDuplicateTracker:
+    """Spots URL patterns (facets, sort orders, calendars) that keep rendering the same page.
+
+    ``observe`` fingerprints each crawled page against earlier pages of the same
+    URL pattern.  Once a pattern has produced ``prune_after`` near-duplicates,
+    further near-duplicate pages of it are pruned: their links are still
+    checked, but no longer crawled.
+    """
+
+    def __init__(self, distance: int = NEAR_DUP_DISTANCE, prune_after: int = PRUNE_AFTER):
+        self.distance = distance
+        self.prune_after = prune_after
+        self._fingerprints = {}  # pattern -> [simhash]
+        self.duplicates = {}  # pattern -> near-duplicate count
+
+    def observe(self, url: str, links, text: str) -> dict:
+        """Fingerprint a page; returns the decision record for the scan report."""
+        pattern = url_pattern(url)
+        fp = simhash(page_features(links, text))
+        seen = self._fingerprints.setdefault(pattern, [])
+        nearest = min((hamming(fp, other) for other in seen), default=None)
+        duplicate = nearest is not None and nearest <= self.distance
+        if duplicate:
+            self.duplicates[pattern] = self.duplicates.get(pattern, 0) + 1
+        elif len(seen) < MAX_FINGERPRINTS_PER_PATTERN:
+            seen.append(fp)
+        return {
+            "url": url,
+            "pattern": pattern,
+            "simhash": f"{fp:016x}",
+            "nearest_distance": nearest,
+            "duplicate": duplicate,
+            "prune": duplicate and self.duplicates[pattern] >= self.prune_after,
+        }
+
+    def pruned_patterns(self) -> list:
+        return sorted(p for p, n in self.duplicates.items() if n >= self.prune_after)
@@ -0,0 +1,68 @@
+import heapq
+import itertools
+from collections import deque
+
+
+class Frontier:
+    """Crawl frontier that never hands out the same URL twice.
+
+    Membership is tracked in a set covering both queued and already visited
+    URLs, so ``push`` is O(1) no matter how large the crawl grows.  URLs are
+    handed out in discovery order, or by ascending ``priority(url, depth)``
+    when a priority function is given; ``depth`` counts links from a seed and
+    is known when ``push`` is told the page the URL was found on.
+    """
+
+    def __init__(self, seeds=(), priority=None):
+        self._queue = deque()
+        self._heap = []  # (score, tiebreak, url) when ordered by priority
+        self._order = itertools.count()
+        self._priority = priority
+        self._seen = set()
+        self._depth = {}
+        for url in seeds:
+            self.push(url)
+
+    def _enqueue(self, url: str):
+        if self._priority is None:
+            self._queue.append(url)
+        else:
+            score = self._priority(url, self._depth.get(url, 0))
+            heapq.heappush(self._heap, (score, next(self._order), url))
+
+    def push(self, url: str, parent: str = None) -> bool:
+        """Queue a URL unless it was queued or visited before; return True if queued."""
+        if not url or url in self._seen:
+            return False
+        self._seen.add(url)
+        if parent is not None and self._priority is not None:
+            self._depth[url] = self._depth.get(parent, 0) + 1
+        self._enqueue(url)
+        return True
+
+    def requeue(self, url: str):
+        """Put a previously popped URL back on the queue (used for retries)."""
+        self._enqueue(url)
+
+    def pop(self) -> str:
+        """Take the next URL to visit (raises IndexError when empty)."""
+        if self._priority is None:
+            return self._queue.popleft()
+        return heapq.heappop(self._heap)[2]
+
+    def done(self, url: str):
+        """Called by the crawler once a popped URL has been fully visited."""
+
+    def depth(self, url: str) -> int:
+        return self._depth.get(url, 0)
+
+    def __len__(self) -> int:
+        return len(self._queue) + len(self._heap)
+
+    def __contains__(self, url: str) -> bool:
+        return url in self._seen
+
+    @property
+    def seen_count(self) -> int:
+        """Number of distinct URLs ever queued (visited plus pending)."""
+        return len(self._seen)
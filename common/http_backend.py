@@ -0,0 +1,92 @@
+import asyncio
+import importlib.util
+import os
+from urllib.parse import urlsplit
+
+try:
+    import httpx
+except ImportError:  # optional: pip install "httpx[http2]"
+    httpx = None
+
+# "playwright" sends checks through the driver's APIRequestContext; "httpx" uses a pooled in-process client
+CHECK_BACKEND = os.environ.get("SCAN_CHECK_BACKEND", "playwright")
+POOL_MAX_CONNECTIONS = 64
+POOL_PER_HOST = 8  # concurrent requests per host on the httpx backend
+
+
+class HttpxResponse:
+    """The slice of Playwright's APIResponse that the scanners use."""
+
+    def __init__(self, resp):
+        self._resp = resp
+        self.status = resp.status_code
+        self.url = str(resp.url)
+        self.headers = {k.lower(): v for k, v in resp.headers.items()}
+
+    async def body(self) -> bytes:
+        return self._resp.content
+
+    async def text(self) -> str:
+        return self._resp.text
+
+
+class HttpxBackend:
+    """Checker backend on a pooled httpx.AsyncClient, bypassing the Playwright driver.
+
+    Connections are kept alive and reused, HTTP/2 is negotiated when the
+    ``h2`` package is installed, and each host gets at most ``per_host``
+    requests in flight.  ``cookies`` are Playwright cookie dicts, e.g. from
+    ``await context.cookies()``, so checks see the browser's session.
+    Implements the same ``head``/``get``/``dispose`` calls as an
+    APIRequestContext.
+    """
+
+    def __init__(self, cookies=(), per_host: int = POOL_PER_HOST,
+                 max_connections: int = POOL_MAX_CONNECTIONS):
+        if httpx is None:
+            raise RuntimeError("The httpx check backend needs the httpx package")
+        jar = httpx.Cookies()
+        for c in cookies or ():
+            jar.set(c["name"], c["value"], domain=c.get("domain", ""), path=c.get("path", "/"))
+        self.http2 = importlib.util.find_spec("h2") is not None
+        self._client = httpx.AsyncClient(
+            http2=self.http2, cookies=jar, follow_redirects=True,
+            limits=httpx.Limits(max_connections=max_connections, max_keepalive_connections=max_connections),
+        )
+        self._per_host = per_host
+        self._host_slots = {}
+
+    async def _request(self, method, url, timeout=None, headers=None):
+        host = urlsplit(url).netloc.lower()
+        slots = self._host_slots.setdefault(host, asyncio.Semaphore(self._per_host))
+        async with slots:
+            # timeouts are given in milliseconds, as for Playwright
+            resp = await self._client.request(method, url, headers=headers,
+                                              timeout=timeout / 1000 if timeout else httpx.USE_CLIENT_DEFAULT)
+        return HttpxResponse(resp)
+
+    async def head(self, url, timeout=None, headers=None):
+        return await self._request("HEAD", url, timeout, headers)
+
+    async def get(self, url, timeout=None, headers=None):
+        return await self._request("GET", url, timeout, headers)
+
+    async def dispose(self):
+        await self._client.aclose()
+
+
+async def open_backend(playwright, name: str = CHECK_BACKEND, cookies=()):
+    """Open the named checker backend; falls back to Playwright if httpx is unavailable.
+
+    Every backend offers ``head``/``get``/``dispose`` with the APIRequestContext
+    signatures, so callers do not care which one they hold.
+    """
+    if name == "httpx":
+        if httpx is not None:
+            return HttpxBackend(cookies)
+        print("  ⚠️ SCAN_CHECK_BACKEND=httpx but httpx is not installed; using Playwright")
+    elif name != "playwright":
+        raise ValueError(f"Unknown check backend: {name!r}")
+    if cookies:
+        return await playwright.request.new_context(storage_state={"cookies": list(cookies), "origins": []})
+    return await playwright.request.new_context()
@@ -0,0 +1,145 @@
+import asyncio
+import random
+import time
+from urllib.parse import urlparse
+
+HOST_RATE_PER_SECOND = 8.0  # sustained requests per host
+HOST_BURST = 8
+BREAKER_FAILURE_THRESHOLD = 5  # consecutive failures before a host's breaker opens
+BREAKER_COOLDOWN_SECONDS = 30.0
+BACKOFF_BASE_SECONDS = 0.5
+BACKOFF_MAX_SECONDS = 10.0
+# Statuses that mean "slow down", not "broken": retried with backoff and counted against the host
+THROTTLE_STATUSES = {429, 502, 503, 504}
+
+
+def _host(url: str) -> str:
+    return urlparse(url).netloc.lower()
+
+
+class TokenBucket:
+    """Classic token bucket; ``acquire`` only delays the caller, never the event loop."""
+
+    def __init__(self, rate: float, burst: int):
+        self.rate = rate
+        self.capacity = burst
+        self.tokens = float(burst)
+        self.updated = time.monotonic()
+
+    def _refill(self):
+        now = time.monotonic()
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+
+    async def acquire(self):
+        while True:
+            self._refill()
+            if self.tokens >= 1:
+                self.tokens -= 1
+                return
+            await asyncio.sleep((1 - self.tokens) / self.rate)
+
+
+class CircuitBreaker:
+    """Opens after repeated consecutive failures; lets one probe through after a cooldown.
+
+    While the probe is in flight (half-open) every other caller is refused; its
+    recorded result closes the breaker or keeps it open for another cooldown.
+    A probe that never reports back frees the slot after one more cooldown.
+    """
+
+    def __init__(self, threshold: int, cooldown: float):
+        self.threshold = threshold
+        self.cooldown = cooldown
+        self.failures = 0
+        self.opened_at = None
+
+    def allow(self) -> bool:
+        if self.opened_at is None:
+            return True
+        if time.monotonic() - self.opened_at >= self.cooldown:
+            # half-open: restarting the cooldown admits exactly this caller until a result is recorded
+            self.opened_at = time.monotonic()
+            return True
+        return False
+
+    @property
+    def is_open(self) -> bool:
+        return self.opened_at is not None
+
+    def record(self, ok: bool):
+        if ok:
+            self.failures = 0
+            self.opened_at = None
+            return
+        self.failures += 1
+        if self.failures >= self.threshold and self.opened_at is None:
+            self.opened_at = time.monotonic()
+
+
+class HostScheduler:
+    """Per-host politeness: token-bucket rate limits, jittered backoff and circuit breakers.
+
+    Callers ``await acquire(url)`` before each request, ``record(url, ok)``
+    afterwards and, instead of sleeping inline on a failure, re-queue the URL
+    after ``backoff(attempt)`` seconds.  While a host's breaker is open,
+    ``allow(url)`` is False and its URLs should be reported as
+    ``circuit_open_status(url)`` without a request.
+    """
+
+    def __init__(self, rate: float = HOST_RATE_PER_SECOND, burst: int = HOST_BURST,
+                 failure_threshold: int = BREAKER_FAILURE_THRESHOLD,
+                 cooldown: float = BREAKER_COOLDOWN_SECONDS):
+        self.rate = rate
+        self.burst = burst
+        self.failure_threshold = failure_threshold
+        self.cooldown = cooldown
+        self._buckets = {}
+        self._breakers = {}
+
+    def _bucket(self, url):
+        host = _host(url)
+        if host not in self._buckets:
+            self._buckets[host] = TokenBucket(self.rate, self.burst)
+        return self._buckets[host]
+
+    def _breaker(self, url):
+        host = _host(url)
+        if host not in self._breakers:
+            self._breakers[host] = CircuitBreaker(self.failure_threshold, self.cooldown)
+        return self._breakers[host]
+
+    async def acquire(self, url: str):
+        await self._bucket(url).acquire()
+
+    def allow(self, url: str) -> bool:
+        return self._breaker(url).allow()
+
+    def record(self, url: str, ok: bool):
+        self._breaker(url).record(ok)
+
+    def is_open(self, url: str) -> bool:
+        """Whether the host's breaker is open; unlike ``allow`` this never takes the probe slot."""
+        return self._breaker(url).is_open
+
+    def open_hosts(self) -> list:
+        return sorted(h for h, b in self._breakers.items() if b.is_open)
+
+    @staticmethod
+    def backoff(attempt: int) -> float:
+        """Full-jitter exponential backoff for the given (1-based) attempt."""
+        return random.uniform(0, min(BACKOFF_MAX_SECONDS, BACKOFF_BASE_SECONDS * 2 ** attempt))
+
+    @staticmethod
+    def circuit_open_status(url: str) -> str:
+        return f"circuit-open: {_host(url)} kept failing, not checked"
+
+
+def is_host_failure(status) -> bool:
+    """Whether a check result counts against the host's circuit breaker.
+
+    Only failed requests (the exception itself) and throttling statuses do.
+    Any other status, or an error string from validating a response the host
+    did send (e.g. ``invalid-image``), is a final result about that URL.
+    """
+    return isinstance(status, Exception) or status in THROTTLE_STATUSES
@@ -0,0 +1,80 @@
+from urllib.parse import urlsplit
+
+PROBE_RANGE_BYTES = 1024  # prefix fetched when a body is needed (enough for every magic number below)
+HEAD_FAILURES_BEFORE_SKIP = 2  # HEAD answers contradicted by GET before a host stops getting HEADs
+
+# (offset, signature) pairs identifying image formats by their first bytes
+IMAGE_SIGNATURES = {
+    "jpeg": [(0, b"\xff\xd8\xff")],
+    "png": [(0, b"\x89PNG\r\n\x1a\n")],
+    "gif": [(0, b"GIF87a"), (0, b"GIF89a")],
+    "webp": [(8, b"WEBP")],
+    "bmp": [(0, b"BM")],
+    "ico": [(0, b"\x00\x00\x01\x00")],
+    "avif": [(4, b"ftypavif"), (4, b"ftypavis")],
+    "tiff": [(0, b"II*\x00"), (0, b"MM\x00*")],
+}
+
+
+def sniff_image(content_type: str, prefix: bytes):
+    """Return None if the body prefix is a real image, else a short reason.
+
+    Catches HTML error pages served with a 200 for an image URL, whatever
+    the extension or Content-Type claims.
+    """
+    content_type = (content_type or "").split(";", 1)[0].strip().lower()
+    if not prefix:
+        return "empty body"
+    if content_type == "image/svg+xml" or content_type.endswith("xml"):
+        head = prefix.lstrip()[:PROBE_RANGE_BYTES].lower()
+        if b"<svg" in head or head.startswith(b"<?xml"):
+            return None
+        return f"{content_type} without <svg>"
+    for signatures in IMAGE_SIGNATURES.values():
+        if any(prefix[offset:offset + len(sig)] == sig for offset, sig in signatures):
+            return None
+    if prefix.lstrip()[:15].lower().startswith((b"<!doctype html", b"<html")):
+        return f"HTML page served as {content_type or 'no Content-Type'}"
+    if content_type.startswith("text/") or "html" in content_type:
+        return f"{content_type} instead of an image"
+    return f"unrecognised image data ({content_type or 'no Content-Type'})"
+
+
+class Prober:
+    """Chooses the cheapest request that answers a status check, learning per host.
+
+    Links are checked with HEAD until a host's HEAD answers have been
+    contradicted by GET ``HEAD_FAILURES_BEFORE_SKIP`` times (405s, errors);
+    from then on that host only gets ranged GETs.  Images always get a ranged
+    GET so the first bytes can be validated.  No check downloads a full body
+    unless the server ignores ``Range``.
+    """
+
+    def __init__(self):
+        self._head_failures = {}  # host -> HEAD answers contradicted by GET
+
+    @staticmethod
+    def _host(url: str) -> str:
+        return urlsplit(url).netloc.lower()
+
+    def head_usable(self, url: str) -> bool:
+        return self._head_failures.get(self._host(url), 0) < HEAD_FAILURES_BEFORE_SKIP
+
+    def record_head(self, url: str, reliable: bool):
+        host = self._host(url)
+        if reliable:
+            self._head_failures.setdefault(host, 0)
+        else:
+            self._head_failures[host] = self._head_failures.get(host, 0) + 1
+
+    def skipped_hosts(self) -> list:
+        return sorted(h for h, n in self._head_failures.items() if n >= HEAD_FAILURES_BEFORE_SKIP)
+
+
+def range_headers(headers=None) -> dict:
+    return {**(headers or {}), "Range": f"bytes=0-{PROBE_RANGE_BYTES - 1}"}
+
+
+def probe_status(status: int) -> int:
+    """Report a 206 to our own Range request as the 200 it stands for."""
+    return 200 if status == 206 else status
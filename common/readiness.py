@@ -0,0 +1,82 @@
+import re
+import time
+from collections import namedtuple
+
+READY_QUIET_MS = 500  # DOM must stay unchanged this long
+READY_TIMEOUT_MS = 10000
+DEFAULT_STRATEGY = "dom-quiet"
+# Strategies handled by page.wait_for_load_state instead of the quiet-DOM detector
+LOAD_STATE_STRATEGIES = ("load", "domcontentloaded", "networkidle")
+
+ReadinessDecision = namedtuple("ReadinessDecision", "url strategy ready elapsed_ms anchors")
+
+# Resolves once no nodes were added/removed/edited for quietMs and the anchor
+# count has not changed; attribute churn (carousels, heartbeats) is ignored.
+DOM_QUIET_JS = r"""
+({quietMs, timeoutMs}) => new Promise(resolve => {
+    const start = performance.now();
+    let lastChange = start;
+    let anchors = document.querySelectorAll('a[href]').length;
+    const observer = new MutationObserver(() => { lastChange = performance.now(); });
+    observer.observe(document.documentElement, {subtree: true, childList: true, characterData: true});
+    const finish = (ready) => {
+        observer.disconnect();
+        resolve({ready, anchors});
+    };
+    const tick = () => {
+        const now = performance.now();
+        const count = document.querySelectorAll('a[href]').length;
+        if (count !== anchors) {
+            anchors = count;
+            lastChange = now;
+        }
+        if (now - lastChange >= quietMs) return finish(true);
+        if (now - start >= timeoutMs) return finish(false);
+        setTimeout(tick, 50);
+    };
+    setTimeout(tick, 50);
+})
+"""
+
+
+def strategy_for(url: str, overrides=()) -> str:
+    """Pick the readiness strategy for a URL from ``[(regex, strategy)]`` overrides."""
+    for pattern, strategy in overrides:
+        if re.search(pattern, url):
+            return strategy
+    return DEFAULT_STRATEGY
+
+
+async def wait_until_ready(page, url: str, overrides=(), quiet_ms: int = READY_QUIET_MS,
+                           timeout_ms: int = READY_TIMEOUT_MS) -> ReadinessDecision:
+    """Wait until a freshly navigated page is ready for link extraction.
+
+    Never raises on a readiness timeout: the page is used as-is and the decision
+    is recorded with ``ready=False``, so long-polling pages are not treated as
+    load failures.
+    """
+    strategy = strategy_for(url, overrides)
+    start = time.monotonic()
+    ready, anchors = False, None
+    try:
+        if strategy in LOAD_STATE_STRATEGIES:
+            await page.wait_for_load_state(strategy, timeout=timeout_ms)
+            ready = True
+        else:
+            result = await page.evaluate(DOM_QUIET_JS, {"quietMs": quiet_ms, "timeoutMs": timeout_ms})
+            ready, anchors = result["ready"], result["anchors"]
+    except Exception as e:
+        # timeouts or a client-side redirect destroying the context
+        print(f"  ⚠️ Readiness ({strategy}) not reached for {url}: {e}")
+    elapsed_ms = int((time.monotonic() - start) * 1000)
+    return ReadinessDecision(url, strategy, ready, elapsed_ms, anchors)
+
+
+def summarize(decisions) -> str:
+    """One-line timing summary of a list of ReadinessDecision."""
+    if not decisions:
+        return "no readiness decisions"
+    times = sorted(d.elapsed_ms for d in decisions)
+    not_ready = sum(1 for d in decisions if not d.ready)
+    return (f"{len(decisions)} pages, median {times[len(times) // 2]} ms, "
+            f"max {times[-1]} ms, {not_ready} not ready before timeout")
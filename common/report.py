@@ -0,0 +1,28 @@
+import json
+import os
+import time
+
+from status_cache import CACHE_DIR
+
+SCAN_REPORT_PATH = os.environ.get("SCAN_REPORT_PATH", os.path.join(CACHE_DIR, "scan-report.jsonl"))
+
+
+class ResultStream:
+    """Writes scan events to a JSON-lines file as they happen.
+
+    Each line is one event with at least ``event`` and ``ts`` keys, so partial
+    results survive a crashed or timed-out run.
+    """
+
+    def __init__(self, path: str = SCAN_REPORT_PATH):
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        self.path = path
+        self._fh = open(path, "w", encoding="utf-8")
+
+    def write(self, event: str, **fields):
+        fields.update(event=event, ts=round(time.time(), 3))
+        self._fh.write(json.dumps(fields, default=str) + "\n")
+        self._fh.flush()
+
+    def close(self):
+        self._fh.close()
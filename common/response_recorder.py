@@ -0,0 +1,65 @@
+from canonical import canonicalize
+
+# Reports <img> elements that finished loading but could not be decoded/rendered.
+# SVGs without intrinsic size legitimately report naturalWidth == 0, so skip them.
+BROKEN_RENDERED_IMAGES_JS = r"""
+() => [...document.images]
+    .filter(img => img.complete && img.naturalWidth === 0)
+    .map(img => img.currentSrc || img.src)
+    .filter(src => src && !src.startsWith('data:') && !/\.svg(\?|#|$)/i.test(src))
+"""
+
+# Failures caused by the crawler navigating away are not evidence of a broken URL
+_IGNORED_FAILURES = ("net::ERR_ABORTED",)
+
+
+def _key(url: str) -> str:
+    return canonicalize(url)
+
+
+class ResponseRecorder:
+    """Remembers the status of every request the browser made while crawling.
+
+    Attach it to each crawl page; the check phase can then reuse what Chromium
+    already fetched and only re-request URLs the browser never loaded.
+    """
+
+    def __init__(self):
+        self._statuses = {}
+
+    def attach(self, page):
+        """Start recording responses and failed requests for a page."""
+        page.on("response", self._on_response)
+        page.on("requestfailed", self._on_request_failed)
+
+    def _on_response(self, response):
+        self._statuses[_key(response.url)] = response.status
+
+    def _on_request_failed(self, request):
+        failure = request.failure or "unknown error"
+        if any(failure.startswith(ignored) for ignored in _IGNORED_FAILURES):
+            return
+        # a successful load seen elsewhere wins over a later failure
+        self._statuses.setdefault(_key(request.url), f"request-failed: {failure}")
+
+    def record(self, url: str, status: int):
+        """Record a status observed outside the browser (e.g. a static page fetch)."""
+        self._statuses[_key(url)] = status
+
+    def merge(self, other):
+        """Fold in statuses recorded elsewhere (e.g. by another crawl shard)."""
+        for key, status in other._statuses.items():
+            if isinstance(status, int) or key not in self._statuses:
+                self._statuses[key] = status
+
+    def status_for(self, url: str):
+        """Return the recorded status (int or error string), or None if never fetched."""
+        return self._statuses.get(_key(url))
+
+    def __len__(self) -> int:
+        return len(self._statuses)
+
+
+async def find_broken_rendered_images(page) -> list:
+    """Return the URLs of images on the page that loaded but have naturalWidth == 0."""
+    return await page.evaluate(BROKEN_RENDERED_IMAGES_JS)
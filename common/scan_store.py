@@ -0,0 +1,143 @@
+import json
+import os
+import sqlite3
+import threading
+import time
+
+from frontier import Frontier
+from status_cache import CACHE_DIR
+
+SCAN_STATE_PATH = os.environ.get("SCAN_STATE_PATH", os.path.join(CACHE_DIR, "scan-state.sqlite"))
+# Continue the previous run's frontier and results instead of starting over
+SCAN_RESUME = os.environ.get("SCAN_RESUME", "") not in ("", "0", "false", "no")
+CHECKPOINT_SECONDS = float(os.environ.get("SCAN_CHECKPOINT_SECONDS", "15"))
+
+_SCHEMA = (
+    "CREATE TABLE IF NOT EXISTS frontier ("
+    " url TEXT PRIMARY KEY, visited INTEGER NOT NULL DEFAULT 0, seq INTEGER NOT NULL)",
+    "CREATE TABLE IF NOT EXISTS found (kind TEXT NOT NULL, url TEXT NOT NULL, PRIMARY KEY (kind, url))",
+    "CREATE TABLE IF NOT EXISTS results ("
+    " kind TEXT NOT NULL, url TEXT NOT NULL, status TEXT NOT NULL, checked_at REAL NOT NULL,"
+    " PRIMARY KEY (kind, url))",
+)
+
+
+class ScanStore:
+    """Durable crawl frontier and check results, so an interrupted scan can resume.
+
+    State is kept in memory and written behind to SQLite: changes are buffered
+    and committed in one transaction at most every ``checkpoint_seconds`` (and
+    on ``checkpoint``/``close``), so a crash loses only the last interval.
+    Without ``resume`` the previous run's state is discarded on open.
+    """
+
+    def __init__(self, path: str = SCAN_STATE_PATH, resume: bool = SCAN_RESUME,
+                 checkpoint_seconds: float = CHECKPOINT_SECONDS):
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        self.path = path
+        self.checkpoint_seconds = checkpoint_seconds
+        self._lock = threading.Lock()
+        self._writes = []  # buffered (sql, params) since the last checkpoint
+        self._last_checkpoint = time.monotonic()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        with self._lock, self._conn:
+            for statement in _SCHEMA:
+                self._conn.execute(statement)
+            if not resume:
+                for table in ("frontier", "found", "results"):
+                    self._conn.execute(f"DELETE FROM {table}")
+        self._frontier = {url: bool(visited) for url, visited in
+                          self._conn.execute("SELECT url, visited FROM frontier ORDER BY seq")}
+        self._found = set(self._conn.execute("SELECT kind, url FROM found"))
+        self._results = {(kind, url): json.loads(status) for kind, url, status in
+                         self._conn.execute("SELECT kind, url, status FROM results")}
+        self.resumed = bool(self._frontier or self._results)
+
+    def _write(self, sql, params):
+        self._writes.append((sql, params))
+        if time.monotonic() - self._last_checkpoint >= self.checkpoint_seconds:
+            self.checkpoint()
+
+    def checkpoint(self):
+        """Commit every buffered change in one transaction."""
+        with self._lock:
+            writes, self._writes = self._writes, []
+            with self._conn:
+                for sql, params in writes:
+                    self._conn.execute(sql, params)
+            self._last_checkpoint = time.monotonic()
+
+    # frontier
+
+    def enqueue(self, url: str):
+        if url in self._frontier:
+            return
+        self._frontier[url] = False
+        self._write("INSERT OR IGNORE INTO frontier (url, visited, seq) VALUES (?, 0, ?)",
+                    (url, len(self._frontier)))
+
+    def mark_visited(self, url: str):
+        self._frontier[url] = True
+        self._write("UPDATE frontier SET visited = 1 WHERE url = ?", (url,))
+
+    def queued(self) -> list:
+        """URLs queued but not yet visited, in discovery order."""
+        return [url for url, visited in self._frontier.items() if not visited]
+
+    def visited(self) -> set:
+        return {url for url, visited in self._frontier.items() if visited}
+
+    # results
+
+    def record_found(self, kind: str, url: str):
+        if (kind, url) in self._found:
+            return
+        self._found.add((kind, url))
+        self._write("INSERT OR IGNORE INTO found (kind, url) VALUES (?, ?)", (kind, url))
+
+    def record_result(self, kind: str, url: str, status):
+        self._results[(kind, url)] = status
+        self._write("INSERT OR REPLACE INTO results (kind, url, status, checked_at) VALUES (?, ?, ?, ?)",
+                    (kind, url, json.dumps(status), time.time()))
+
+    def results(self) -> list:
+        """``(kind, url, status)`` for every result recorded by this or a resumed run."""
+        return [(kind, url, status) for (kind, url), status in self._results.items()]
+
+    def unchecked(self) -> list:
+        """``(kind, url)`` pairs found earlier whose check never completed."""
+        return sorted(key for key in self._found if key not in self._results)
+
+    @property
+    def checked_count(self) -> int:
+        return len(self._results)
+
+    def close(self):
+        self.checkpoint()
+        self._conn.close()
+
+
+class PersistentFrontier(Frontier):
+    """Frontier mirrored into a ScanStore.
+
+    On a resumed store it starts from the stored queue, and URLs visited by
+    the earlier run are never handed out again; ``seeds`` only apply to a
+    fresh store.
+    """
+
+    def __init__(self, store: ScanStore, seeds=(), priority=None):
+        super().__init__(priority=priority)
+        self._store = store
+        self._seen.update(store.visited())
+        queued = store.queued()
+        for url in queued or seeds:
+            self.push(url)
+
+    def push(self, url: str, parent: str = None) -> bool:
+        if not super().push(url, parent):
+            return False
+        self._store.enqueue(url)
+        return True
+
+    def done(self, url: str):
+        self._store.mark_visited(url)
@@ -0,0 +1,79 @@
+import json
+import os
+import time
+from contextlib import contextmanager
+
+LOCK_POLL_SECONDS = 0.2
+LOCK_STALE_SECONDS = 120  # a bootstrap lock older than this was left by a crashed worker
+
+
+class SessionState:
+    """A saved Playwright ``storage_state`` file shared by runs and parallel workers.
+
+    One worker logs in under ``bootstrap_lock`` and saves the state; everyone
+    else opens contexts with ``storage_state=session.path``.  The file stays
+    valid until a caller sees the login gate again and calls ``invalidate``.
+    Works with the sync and async APIs alike: callers pass the dict returned
+    by ``context.storage_state()`` to ``save``.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self._lock_path = path + ".lock"
+
+    def exists(self) -> bool:
+        return os.path.exists(self.path)
+
+    def save(self, state: dict):
+        """Write the state atomically, so readers never see a half-written file."""
+        os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+        tmp = f"{self.path}.{os.getpid()}.tmp"
+        with open(tmp, "w", encoding="utf-8") as fh:
+            json.dump(state, fh)
+        os.replace(tmp, self.path)
+
+    def load(self):
+        """The saved state dict, or None if there is none (or it is unreadable)."""
+        try:
+            with open(self.path, encoding="utf-8") as fh:
+                return json.load(fh)
+        except (OSError, ValueError):
+            return None
+
+    def cookies(self) -> list:
+        state = self.load()
+        return state.get("cookies", []) if state else []
+
+    def invalidate(self):
+        try:
+            os.remove(self.path)
+        except FileNotFoundError:
+            pass
+
+    @contextmanager
+    def bootstrap_lock(self, timeout: float = LOCK_STALE_SECONDS):
+        """Cross-process lock so only one worker runs the login flow at a time."""
+        os.makedirs(os.path.dirname(os.path.abspath(self._lock_path)), exist_ok=True)
+        deadline = time.time() + timeout
+        while True:
+            try:
+                fd = os.open(self._lock_path, os.O_CREAT | os.O_EXCL | os.O_WRONLY)
+                os.close(fd)
+                break
+            except FileExistsError:
+                try:
+                    if time.time() - os.path.getmtime(self._lock_path) > LOCK_STALE_SECONDS:
+                        os.remove(self._lock_path)
+                        continue
+                except FileNotFoundError:
+                    continue
+                if time.time() > deadline:
+                    raise TimeoutError(f"Timed out waiting for {self._lock_path}")
+                time.sleep(LOCK_POLL_SECONDS)
+        try:
+            yield
+        finally:
+            try:
+                os.remove(self._lock_path)
+            except FileNotFoundError:
+                pass
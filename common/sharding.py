@@ -0,0 +1,184 @@
+import asyncio
+import hashlib
+import multiprocessing
+import queue
+
+from frontier import Frontier
+
+REMOTE_POLL_SECONDS = 0.05
+
+
+def shard_for(url: str, shard_count: int) -> int:
+    """Stable owner shard of a URL (hash() is salted per process, so use a digest)."""
+    digest = hashlib.blake2b(url.encode("utf-8"), digest_size=8).digest()
+    return int.from_bytes(digest, "big") % shard_count
+
+
+class SharedPageBudget:
+    """Page budget counted across all shard processes."""
+
+    def __init__(self, max_pages: int, taken):
+        self.max_pages = max_pages
+        self._taken = taken
+
+    def take(self):
+        with self._taken.get_lock():
+            self._taken.value += 1
+
+    def exhausted(self) -> bool:
+        return self._taken.value >= self.max_pages
+
+
+class ShardedFrontier(Frontier):
+    """Frontier of one shard: keeps the URLs it owns and routes the rest.
+
+    URLs owned by another shard are sent to that shard's inbox queue together
+    with their depth, so priorities rank them as a single-process crawl would.
+    ``pending`` is a cross-process counter of URLs queued, in transit or being
+    visited anywhere; the crawl is finished when it reaches zero.  URLs in
+    ``seen`` (visited by an earlier run) are never queued, and with a
+    ``journal`` queue every URL this shard queues or visits is reported as
+    ``("queued", url)`` / ``("visited", url)`` so the parent can persist it.
+    """
+
+    def __init__(self, shard_id: int, shard_count: int, inboxes, pending, priority=None, seen=(),
+                 journal=None):
+        super().__init__(priority=priority)
+        self.shard_id = shard_id
+        self.shard_count = shard_count
+        self._inboxes = inboxes
+        self._pending = pending
+        self._journal = journal
+        self._seen.update(seen)
+        self._routed = set()  # remote URLs already sent, to keep queue traffic down
+
+    def _add_pending(self, delta: int):
+        with self._pending.get_lock():
+            self._pending.value += delta
+
+    def _accept(self, url: str, parent: str = None, depth: int = 0) -> bool:
+        if depth and self._priority is not None and url not in self._seen:
+            self._depth[url] = depth  # found on another shard, which knew its parent's depth
+        if super().push(url, parent):
+            self._add_pending(1)
+            if self._journal is not None:
+                self._journal.put(("queued", url))
+            return True
+        return False
+
+    def push(self, url: str, parent: str = None) -> bool:
+        if not url:
+            return False
+        owner = shard_for(url, self.shard_count)
+        if owner == self.shard_id:
+            return self._accept(url, parent)
+        if url in self._routed:
+            return False
+        self._routed.add(url)
+        self._add_pending(1)  # in transit until the owner drains it
+        depth = self.depth(parent) + 1 if parent is not None else 0
+        self._inboxes[owner].put((url, depth))
+        return True
+
+    def _drain(self):
+        inbox = self._inboxes[self.shard_id]
+        while True:
+            try:
+                url, depth = inbox.get_nowait()
+            except queue.Empty:
+                return
+            self._accept(url, depth=depth)
+            self._add_pending(-1)
+
+    def done(self, url: str):
+        self._add_pending(-1)
+        if self._journal is not None:
+            self._journal.put(("visited", url))
+
+    def __len__(self) -> int:
+        self._drain()
+        return super().__len__()
+
+    async def wait_for_remote(self, should_stop) -> bool:
+        """Wait for URLs from other shards; False once the whole crawl is idle."""
+        while not should_stop():
+            if len(self):
+                return True
+            if self._pending.value == 0:
+                return False
+            await asyncio.sleep(REMOTE_POLL_SECONDS)
+        return False
+
+
+def spawn_queue(maxsize: int = 0):
+    """A queue that can be handed to shard processes through run_sharded's extra_args."""
+    return multiprocessing.get_context("spawn").Queue(maxsize)
+
+
+def _shard_entry(target, shard_id, shard_count, inboxes, pending, taken, max_pages, budget, priority,
+                 results, extra_args, seen, journal):
+    frontier = ShardedFrontier(shard_id, shard_count, inboxes, pending, priority, seen, journal)
+    if budget is None:
+        budget = SharedPageBudget(max_pages, taken)
+    elif hasattr(budget, "share_pages"):
+        # a per-process page count would let one shard stop while the rest wait on its queue
+        budget.share_pages(taken)
+    try:
+        results.put((shard_id, target(frontier, budget, *extra_args), None))
+    except Exception as e:
+        results.put((shard_id, None, f"{type(e).__name__}: {e}"))
+    finally:
+        # URLs routed to a shard that already stopped are never read; do not block exit on them
+        for inbox in inboxes:
+            inbox.cancel_join_thread()
+
+
+def run_sharded(target, shard_count: int, seeds, max_pages: int = None, extra_args=(), budget=None,
+                priority=None, seen=(), journal=None) -> list:
+    """Run ``target(frontier, budget, *extra_args)`` in ``shard_count`` processes.
+
+    ``target`` must be a picklable module-level function; each process gets a
+    ShardedFrontier for its share of the URL space and a page budget shared by
+    all shards.  A picklable ``budget`` (such as a crawler.TimeBudget, whose
+    deadline holds across processes) is given to every shard instead; if it
+    has ``share_pages(taken)`` its page count is shared as well.  A
+    picklable ``priority`` orders each shard's frontier.  ``seen`` URLs are
+    never crawled, and a spawn_queue() ``journal`` receives the frontier
+    events described in ShardedFrontier.  ``extra_args`` must be picklable or
+    spawn_queue() queues.
+    Returns the per-shard return values ordered by shard id.
+    """
+    ctx = multiprocessing.get_context("spawn")  # Playwright does not survive fork()
+    inboxes = [ctx.Queue() for _ in range(shard_count)]
+    pending = ctx.Value("i", 0)
+    taken = ctx.Value("i", 0)
+    results = ctx.Queue()
+    # each shard only needs the visited URLs it owns
+    seen_by_shard = [set() for _ in range(shard_count)]
+    for url in seen:
+        seen_by_shard[shard_for(url, shard_count)].add(url)
+    for url in seeds:
+        pending.value += 1
+        inboxes[shard_for(url, shard_count)].put((url, 0))
+
+    procs = [
+        ctx.Process(target=_shard_entry, name=f"crawl-shard-{i}",
+                    args=(target, i, shard_count, inboxes, pending, taken, max_pages, budget, priority,
+                          results, extra_args, seen_by_shard[i], journal))
+        for i in range(shard_count)
+    ]
+    for proc in procs:
+        proc.start()
+    # read results before joining so large payloads cannot block the children
+    collected = {}
+    errors = []
+    for _ in procs:
+        shard_id, result, error = results.get()
+        if error:
+            errors.append(f"shard {shard_id}: {error}")
+        collected[shard_id] = result
+    for proc in procs:
+        proc.join()
+    if errors:
+        raise RuntimeError("Sharded crawl failed: " + "; ".join(errors))
+    return [collected[i] for i in range(shard_count)]
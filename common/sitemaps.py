@@ -0,0 +1,141 @@
+import zlib
+from collections import namedtuple
+from datetime import datetime, timezone
+from urllib.parse import urljoin
+from urllib.robotparser import RobotFileParser
+from xml.etree.ElementTree import ParseError, XMLPullParser
+
+MAX_SITEMAPS = 50  # sitemap files fetched per run, including those listed in indexes
+MAX_SITEMAP_URLS = 50000  # the sitemap protocol's per-file limit, applied per run
+PARSE_CHUNK_SIZE = 64 * 1024
+ROBOTS_USER_AGENT = "*"
+
+SitemapEntry = namedtuple("SitemapEntry", "url lastmod priority")
+
+
+class RobotsRules:
+    """Parsed robots.txt: disallow rules and ``Sitemap:`` lines.
+
+    A missing or unreadable robots.txt allows everything, as crawlers do.
+    Plain data, so it can be handed to shard processes.
+    """
+
+    def __init__(self, base_url: str, text: str = ""):
+        self.url = urljoin(base_url, "/robots.txt")
+        self._parser = RobotFileParser(self.url)
+        self._parser.parse(text.splitlines())
+        self.sitemaps = list(self._parser.site_maps() or [])
+
+    def allowed(self, url: str) -> bool:
+        return self._parser.can_fetch(ROBOTS_USER_AGENT, url)
+
+
+async def fetch_robots(request_ctx, base_url: str, timeout_ms: int) -> RobotsRules:
+    url = urljoin(base_url, "/robots.txt")
+    try:
+        resp = await request_ctx.get(url, timeout=timeout_ms)
+        if resp.status < 400:
+            return RobotsRules(base_url, await resp.text())
+    except Exception as e:
+        print(f"  ⚠️ Could not fetch {url}: {e}")
+    return RobotsRules(base_url)
+
+
+def parse_lastmod(value):
+    """Unix time of a W3C datetime (``2024-05-01``, ``2024-05-01T10:00:00Z``), or None."""
+    if not value:
+        return None
+    try:
+        parsed = datetime.fromisoformat(value.strip().replace("Z", "+00:00"))
+    except ValueError:
+        return None
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=timezone.utc)
+    return parsed.timestamp()
+
+
+def _local(tag: str) -> str:
+    return tag.rsplit("}", 1)[-1]
+
+
+def _chunks(body: bytes):
+    """Yield the sitemap body in chunks, gunzipping on the fly when needed."""
+    inflate = zlib.decompressobj(16 + zlib.MAX_WBITS) if body[:2] == b"\x1f\x8b" else None
+    for i in range(0, len(body), PARSE_CHUNK_SIZE):
+        chunk = body[i:i + PARSE_CHUNK_SIZE]
+        yield inflate.decompress(chunk) if inflate else chunk
+    if inflate:
+        yield inflate.flush()
+
+
+def parse_sitemap(body: bytes):
+    """Yield ``("url" | "sitemap", SitemapEntry)`` from a urlset or sitemap index.
+
+    The document is fed to an incremental parser chunk by chunk and elements
+    are discarded once read, so large sitemaps never sit in memory as a tree.
+    """
+    parser = XMLPullParser(events=("end",))
+    fields = {}
+    for chunk in _chunks(body):
+        parser.feed(chunk)
+        for _, elem in parser.read_events():
+            tag = _local(elem.tag)
+            if tag in ("loc", "lastmod", "priority"):
+                fields[tag] = (elem.text or "").strip()
+            elif tag in ("url", "sitemap"):
+                if fields.get("loc"):
+                    try:
+                        priority = float(fields["priority"]) if fields.get("priority") else None
+                    except ValueError:
+                        priority = None
+                    yield tag, SitemapEntry(fields["loc"], parse_lastmod(fields.get("lastmod")), priority)
+                fields = {}
+                elem.clear()
+    parser.close()
+
+
+async def iter_sitemap_urls(request_ctx, sitemap_urls, timeout_ms: int):
+    """Async generator of SitemapEntry for every page listed in the given sitemaps.
+
+    Sitemap indexes are followed (up to MAX_SITEMAPS files in total) and
+    gzipped sitemaps are inflated.  Unreachable or malformed sitemaps are
+    reported and skipped.
+    """
+    pending = list(sitemap_urls)
+    fetched = set()
+    emitted = 0
+    while pending and len(fetched) < MAX_SITEMAPS:
+        sitemap_url = pending.pop(0)
+        if sitemap_url in fetched:
+            continue
+        fetched.add(sitemap_url)
+        try:
+            resp = await request_ctx.get(sitemap_url, timeout=timeout_ms)
+            if resp.status >= 400:
+                print(f"  ⚠️ Sitemap {sitemap_url} -> HTTP {resp.status}")
+                continue
+            body = await resp.body()
+        except Exception as e:
+            print(f"  ⚠️ Could not fetch sitemap {sitemap_url}: {e}")
+            continue
+        try:
+            for kind, entry in parse_sitemap(body):
+                if kind == "sitemap":
+                    pending.append(urljoin(sitemap_url, entry.url))
+                    continue
+                yield entry._replace(url=urljoin(sitemap_url, entry.url))
+                emitted += 1
+                if emitted >= MAX_SITEMAP_URLS:
+                    return
+        except (ParseError, zlib.error) as e:
+            print(f"  ⚠️ Malformed sitemap {sitemap_url}: {e}")
+
+
+def unchanged_since_crawl(cache_entry, lastmod) -> bool:
+    """True when a page was healthy and its sitemap lastmod predates its last crawl.
+
+    Uses ``crawled_at``, not ``checked_at``: a page that was only ever
+    status-checked has never had its images and links looked at.
+    """
+    return (cache_entry is not None and lastmod is not None and cache_entry.crawled_at is not None
+            and cache_entry.status < 400 and lastmod <= cache_entry.crawled_at)
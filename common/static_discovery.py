@@ -0,0 +1,145 @@
+import re
+from html.parser import HTMLParser
+from urllib.parse import urljoin
+
+from extract import TEXT_SKELETON_CHARS
+
+FEED_CHUNK_SIZE = 64 * 1024
+# Below this many anchors a page that ships scripts is assumed to build its links client-side
+MIN_STATIC_ANCHORS = 3
+# Mount points of client-rendered apps (React/Vue/Next/Nuxt/Angular shells)
+APP_SHELL_IDS = {"root", "app", "__next", "__nuxt"}
+APP_SHELL_TAGS = {"app-root"}
+MIN_STATIC_TEXT_CHARS = 200
+
+_CSS_URL_RE = re.compile(r"""url\(\s*(['"]?)(.*?)\1\s*\)""")
+
+
+class LinkExtractor(HTMLParser):
+    """Streaming HTML parser that collects the same URLs as extract.EXTRACT_URLS_JS.
+
+    Feed it chunks as they arrive; ``links`` and ``images`` hold absolute URLs
+    resolved against the page URL (or its ``<base href>``).  It also gathers a
+    few signals used to decide whether the page needs a real browser render.
+    """
+
+    def __init__(self, page_url: str):
+        super().__init__(convert_charrefs=True)
+        self.base = page_url
+        self.links = set()
+        self.images = set()
+        self.anchor_count = 0
+        self.script_count = 0
+        self.text_chars = 0
+        self.app_shell = False
+        self._text_parts = []  # visible text, capped like extract.EXTRACT_URLS_JS
+        self._skip_text = 0
+        self._picture_depth = 0
+
+    def _resolve(self, raw):
+        if not raw:
+            return None
+        raw = raw.strip()
+        if not raw or raw.startswith("#"):
+            return None
+        return urljoin(self.base, raw)
+
+    def _add_image(self, raw):
+        full = self._resolve(raw)
+        if full:
+            self.images.add(full)
+
+    def _add_srcset(self, value):
+        if not value:
+            return
+        for candidate in value.split(","):
+            parts = candidate.strip().split()
+            if parts:
+                self._add_image(parts[0])
+
+    def handle_starttag(self, tag, attrs):
+        a = dict(attrs)
+        if tag == "base" and a.get("href"):
+            self.base = urljoin(self.base, a["href"])
+        elif tag == "a" and a.get("href") is not None:
+            self.anchor_count += 1
+            full = self._resolve(a["href"])
+            if full:
+                self.links.add(full)
+        elif tag == "img":
+            self._add_image(a.get("src"))
+            self._add_srcset(a.get("srcset"))
+        elif tag == "picture":
+            self._picture_depth += 1
+        elif tag == "source" and self._picture_depth:
+            self._add_image(a.get("src"))
+            self._add_srcset(a.get("srcset"))
+        elif tag == "script":
+            self.script_count += 1
+        if tag in ("script", "style", "noscript"):
+            self._skip_text += 1
+
+        # lazy-loading attributes and inline background images on any element
+        for name in ("data-src", "data-lazy", "data-lazy-src"):
+            self._add_image(a.get(name))
+        self._add_srcset(a.get("data-srcset"))
+        style = a.get("style")
+        if style and "url(" in style:
+            for m in _CSS_URL_RE.finditer(style):
+                self._add_image(m.group(2))
+        if a.get("id") in APP_SHELL_IDS or tag in APP_SHELL_TAGS:
+            self.app_shell = True
+
+    def handle_endtag(self, tag):
+        if tag == "picture" and self._picture_depth:
+            self._picture_depth -= 1
+        if tag in ("script", "style", "noscript") and self._skip_text:
+            self._skip_text -= 1
+
+    def handle_data(self, data):
+        if not self._skip_text:
+            stripped = data.strip()
+            if stripped and self.text_chars < TEXT_SKELETON_CHARS:
+                self._text_parts.append(stripped)
+            self.text_chars += len(stripped)
+
+    @property
+    def text(self) -> str:
+        return " ".join(self._text_parts)[:TEXT_SKELETON_CHARS]
+
+
+def needs_render(url: str, extractor: LinkExtractor, render_patterns=()) -> bool:
+    """Decide whether a statically parsed page must be rendered in the browser.
+
+    True when the URL matches a configured pattern, or when the HTML looks like
+    a client-rendered shell: an app mount point with little server text, or
+    scripts but hardly any anchors.
+    """
+    if any(re.search(p, url) for p in render_patterns):
+        return True
+    if extractor.app_shell and extractor.text_chars < MIN_STATIC_TEXT_CHARS:
+        return True
+    return extractor.script_count > 0 and extractor.anchor_count < MIN_STATIC_ANCHORS
+
+
+def parse_html(page_url: str, html: str) -> LinkExtractor:
+    """Run the streaming extractor over an HTML document in chunks."""
+    extractor = LinkExtractor(page_url)
+    for i in range(0, len(html), FEED_CHUNK_SIZE):
+        extractor.feed(html[i:i + FEED_CHUNK_SIZE])
+    extractor.close()
+    return extractor
+
+
+async def fetch_static(request_ctx, url: str, timeout_ms: int):
+    """Fetch a page over the request context without rendering it.
+
+    Returns ``(status, extractor)``; ``extractor`` is None for error responses
+    and non-HTML content.
+    """
+    resp = await request_ctx.get(url, timeout=timeout_ms)
+    content_type = resp.headers.get("content-type", "")
+    if resp.status >= 400 or "html" not in content_type:
+        return resp.status, None
+    # resolve relative links against the final URL after redirects
+    return resp.status, parse_html(resp.url, await resp.text())
@@ -0,0 +1,125 @@
+import os
+import sqlite3
+import threading
+import time
+from collections import namedtuple
+
+from canonical import canonicalize
+
+# Shared on-disk cache directory for the scanners (ignored by git)
+CACHE_DIR = os.environ.get(
+    "SCAN_CACHE_DIR", os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir, ".scan-cache"))
+STATUS_CACHE_PATH = os.path.join(CACHE_DIR, "status_cache.sqlite")
+STATUS_CACHE_TTL_SECONDS = int(os.environ.get("STATUS_CACHE_TTL_SECONDS", 7 * 24 * 3600))
+
+# checked_at: last status check of any kind; crawled_at: last time the page itself was visited
+CacheEntry = namedtuple("CacheEntry", "status etag last_modified checked_at crawled_at")
+
+
+def cache_key(url: str) -> str:
+    return canonicalize(url)
+
+
+class StatusCache:
+    """SQLite-backed HTTP status cache shared across scanner runs.
+
+    Entries older than the TTL are evicted.  Live entries for healthy URLs are
+    revalidated with If-None-Match / If-Modified-Since, so an unchanged asset
+    costs a bodiless 304 instead of a full check.
+    """
+
+    def __init__(self, path: str = STATUS_CACHE_PATH, ttl_seconds: int = STATUS_CACHE_TTL_SECONDS):
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        self.ttl_seconds = ttl_seconds
+        self.hits = 0  # checks answered by a 304
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        with self._lock, self._conn:
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS status ("
+                " url TEXT PRIMARY KEY, status INTEGER NOT NULL,"
+                " etag TEXT, last_modified TEXT, checked_at REAL NOT NULL, crawled_at REAL)"
+            )
+            columns = {row[1] for row in self._conn.execute("PRAGMA table_info(status)")}
+            if "crawled_at" not in columns:  # cache written before crawl times were kept
+                self._conn.execute("ALTER TABLE status ADD COLUMN crawled_at REAL")
+        self.evict_expired()
+
+    def evict_expired(self) -> int:
+        """Drop entries older than the TTL; return how many were removed."""
+        cutoff = time.time() - self.ttl_seconds
+        with self._lock, self._conn:
+            return self._conn.execute("DELETE FROM status WHERE checked_at < ?", (cutoff,)).rowcount
+
+    def get(self, url: str):
+        """Return the live CacheEntry for a URL, or None."""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT status, etag, last_modified, checked_at, crawled_at FROM status WHERE url = ?",
+                (cache_key(url),),
+            ).fetchone()
+        if not row or row[3] < time.time() - self.ttl_seconds:
+            return None
+        return CacheEntry(*row)
+
+    def entries(self) -> list:
+        """``(url, CacheEntry)`` for every live entry."""
+        cutoff = time.time() - self.ttl_seconds
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT url, status, etag, last_modified, checked_at, crawled_at FROM status WHERE checked_at >= ?",
+                (cutoff,),
+            ).fetchall()
+        return [(row[0], CacheEntry(*row[1:])) for row in rows]
+
+    def conditional_headers(self, url: str) -> dict:
+        """Validators to send with the next request for a URL that was healthy last time."""
+        entry = self.get(url)
+        if not entry or entry.status >= 400:
+            return {}
+        headers = {}
+        if entry.etag:
+            headers["If-None-Match"] = entry.etag
+        if entry.last_modified:
+            headers["If-Modified-Since"] = entry.last_modified
+        return headers
+
+    def store(self, url: str, status: int, headers=None):
+        """Record a fresh status and the validators from the response headers."""
+        headers = {k.lower(): v for k, v in (headers or {}).items()}
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT INTO status (url, status, etag, last_modified, checked_at) VALUES (?, ?, ?, ?, ?)"
+                " ON CONFLICT (url) DO UPDATE SET status = excluded.status, etag = excluded.etag,"
+                " last_modified = excluded.last_modified, checked_at = excluded.checked_at",
+                (cache_key(url), status, headers.get("etag"), headers.get("last-modified"), time.time()),
+            )
+
+    def observed(self, url: str, status: int):
+        """Record the status of a crawled page; validators are kept only if the status is unchanged.
+
+        Only this sets ``crawled_at``: plain status checks and 304s refresh ``checked_at`` alone.
+        """
+        now = time.time()
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT INTO status (url, status, checked_at, crawled_at) VALUES (?, ?, ?, ?)"
+                " ON CONFLICT (url) DO UPDATE SET"
+                " etag = CASE WHEN status = excluded.status THEN etag END,"
+                " last_modified = CASE WHEN status = excluded.status THEN last_modified END,"
+                " status = excluded.status, checked_at = excluded.checked_at, crawled_at = excluded.crawled_at",
+                (cache_key(url), status, now, now),
+            )
+
+    def revalidated(self, url: str):
+        """Handle a 304: refresh the entry's check time and return the cached status."""
+        entry = self.get(url)
+        if entry is None:
+            return None
+        with self._lock, self._conn:
+            self._conn.execute("UPDATE status SET checked_at = ? WHERE url = ?", (time.time(), cache_key(url)))
+        self.hits += 1
+        return entry.status
+
+    def close(self):
+        self._conn.close()
@@ -0,0 +1,78 @@
+import pytest
+
+import canonical
+from canonical import canonicalize, normalize_url
+
+
+@pytest.mark.parametrize("url, expected", [
+    ("HTTPS://Example.COM/a", "https://example.com/a"),
+    ("https://example.com:443/a", "https://example.com/a"),
+    ("http://example.com:80/a", "http://example.com/a"),
+    ("http://example.com:8080/a", "http://example.com:8080/a"),
+    ("https://example.com", "https://example.com/"),
+    ("https://example.com/a#section", "https://example.com/a"),
+    ("https://example.com//a///b", "https://example.com/a/b"),
+    ("https://example.com/a/./b/../c", "https://example.com/a/c"),
+    ("https://example.com/a/..", "https://example.com/"),
+    ("https://user:pw@Example.com/", "https://user:pw@example.com/"),
+    ("https://[::1]:8443/a", "https://[::1]:8443/a"),
+])
+def test_scheme_host_port_path_and_fragment(url, expected):
+    assert canonicalize(url) == expected
+
+
+def test_drops_tracking_params():
+    url = "https://example.com/p?utm_source=x&id=7&UTM_Medium=y&gclid=abc&fbclid=z"
+    assert canonicalize(url) == "https://example.com/p?id=7"
+    assert canonicalize("https://example.com/p?utm_source=x") == "https://example.com/p"
+
+
+def test_sorts_params_by_name():
+    assert canonicalize("https://example.com/p?b=2&a=1") == "https://example.com/p?a=1&b=2"
+
+
+def test_keeps_repeated_params_in_order():
+    assert canonicalize("https://example.com/p?t=2&a=1&t=1") == "https://example.com/p?a=1&t=2&t=1"
+
+
+def test_keeps_bare_keys():
+    assert canonicalize("https://example.com/p?flag") == "https://example.com/p?flag"
+    assert canonicalize("https://example.com/p?flag=&b") == "https://example.com/p?b&flag="
+
+
+def test_keeps_original_encoding():
+    assert canonicalize("https://example.com/s?q=a%20b") == "https://example.com/s?q=a%20b"
+    assert canonicalize("https://example.com/s?q=a+b") == "https://example.com/s?q=a+b"
+    assert canonicalize("https://example.com/s?q=%2F%3D") == "https://example.com/s?q=%2F%3D"
+
+
+def test_encoded_tracking_param_name_is_dropped():
+    assert canonicalize("https://example.com/p?utm%5Fsource=x&id=1") == "https://example.com/p?id=1"
+
+
+def test_empty_params_are_dropped():
+    assert canonicalize("https://example.com/p?&a=1&&") == "https://example.com/p?a=1"
+    assert canonicalize("https://example.com/p?") == "https://example.com/p"
+
+
+def test_non_http_urls_are_unchanged():
+    assert canonicalize("ftp://Example.com/a#b") == "ftp://Example.com/a#b"
+
+
+def test_configure_replaces_tracking_params():
+    saved = list(canonical.TRACKING_PARAMS)
+    try:
+        canonical.configure(["ref"])
+        assert canonicalize("https://example.com/?ref=x&utm_source=y") == "https://example.com/?utm_source=y"
+    finally:
+        canonical.configure(saved)
+    assert canonicalize("https://example.com/?ref=x&utm_source=y") == "https://example.com/?ref=x"
+
+
+@pytest.mark.parametrize("link", ["", "#top", "javascript:void(0)", "mailto:a@b.c", "tel:123", "data:image/png;base64,"])
+def test_normalize_url_skips_non_resources(link):
+    assert normalize_url("https://example.com/", link) is None
+
+
+def test_normalize_url_resolves_and_canonicalizes():
+    assert normalize_url("https://Example.com/a/b", " ../c?utm_source=x#f ") == "https://example.com/c"
@@ -0,0 +1,114 @@
+import asyncio
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from check_engine import CheckPipeline
+from politeness import HostScheduler, is_host_failure
+
+httpx = pytest.importorskip("httpx")
+from http_backend import HttpxBackend  # noqa: E402
+
+PNG = b"\x89PNG\r\n\x1a\n" + b"\x00" * 64
+HTML = b"<!DOCTYPE html><html><body>Not found, but with a 200</body></html>"
+
+
+class SiteHandler(BaseHTTPRequestHandler):
+    """/badN.jpg: HTML served with a 200; /ok.png: a PNG; /page: HTML; /busy: 503; else 404."""
+
+    def _answer(self, with_body):
+        path = self.path.split("?")[0]
+        if path.startswith("/bad") or path == "/page":
+            status, content_type, body = 200, "text/html", HTML
+        elif path == "/ok.png":
+            status, content_type, body = 200, "image/png", PNG
+        elif path == "/busy":
+            status, content_type, body = 503, "text/plain", b"busy"
+        else:
+            status, content_type, body = 404, "text/plain", b"missing"
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        if with_body:
+            self.wfile.write(body)
+
+    def do_GET(self):
+        self._answer(True)
+
+    def do_HEAD(self):
+        self._answer(False)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture(scope="module")
+def site():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), SiteHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_address[1]}"
+    server.shutdown()
+    server.server_close()
+
+
+def run_pipeline(items, scheduler, retries=3):
+    results = {}
+
+    async def main():
+        backend = HttpxBackend()
+        try:
+            async with CheckPipeline(backend, lambda kind, url, status: results.setdefault(url, status),
+                                     scheduler=scheduler, retries=retries) as pipeline:
+                for kind, url in items:
+                    await pipeline.submit(kind, url)
+            return pipeline
+        finally:
+            await backend.dispose()
+
+    return asyncio.run(main()), results
+
+
+def test_invalid_images_are_final_and_do_not_trip_the_breaker(site):
+    scheduler = HostScheduler(failure_threshold=5)
+    bad = [f"{site}/bad{i}.jpg" for i in range(7)]
+    items = [("image", url) for url in bad] + [("image", f"{site}/ok.png"), ("link", f"{site}/page")]
+    pipeline, results = run_pipeline(items, scheduler)
+
+    for url in bad:
+        assert results[url].startswith("invalid-image: HTML page served as text/html")
+    assert results[f"{site}/ok.png"] == 200
+    assert results[f"{site}/page"] == 200
+    assert pipeline.retries_scheduled == 0
+    assert scheduler.open_hosts() == []
+
+
+def test_throttled_host_is_retried_and_trips_the_breaker(site):
+    scheduler = HostScheduler(failure_threshold=2)
+    pipeline, results = run_pipeline([("link", f"{site}/busy"), ("link", f"{site}/busy?again")],
+                                     scheduler, retries=2)
+
+    assert pipeline.retries_scheduled >= 1
+    assert scheduler.open_hosts() == ["127.0.0.1:" + site.rsplit(":", 1)[1]]
+    assert all(status == 503 or str(status).startswith("circuit-open") for status in results.values())
+
+
+def test_missing_url_is_a_final_404(site):
+    scheduler = HostScheduler()
+    pipeline, results = run_pipeline([("link", f"{site}/nope")], scheduler)
+    assert results == {f"{site}/nope": 404}
+    assert pipeline.retries_scheduled == 0
+
+
+@pytest.mark.parametrize("status, counts", [
+    (TimeoutError("timed out"), True),
+    (503, True),
+    (429, True),
+    (404, False),
+    (200, False),
+    ("invalid-image: HTML page served as text/html", False),
+])
+def test_is_host_failure(status, counts):
+    assert is_host_failure(status) is counts
@@ -0,0 +1,47 @@
+import time
+
+from politeness import CircuitBreaker, HostScheduler
+
+
+def opened_breaker(threshold=2, cooldown=0.05):
+    breaker = CircuitBreaker(threshold, cooldown)
+    for _ in range(threshold):
+        breaker.record(False)
+    return breaker
+
+
+def test_breaker_opens_after_consecutive_failures():
+    breaker = opened_breaker()
+    assert breaker.is_open
+    assert not breaker.allow()
+
+
+def test_half_open_admits_exactly_one_probe():
+    breaker = opened_breaker()
+    time.sleep(breaker.cooldown)
+    assert breaker.allow()
+    assert not any(breaker.allow() for _ in range(16))
+
+
+def test_probe_result_closes_or_keeps_the_breaker_open():
+    closed = opened_breaker()
+    time.sleep(closed.cooldown)
+    assert closed.allow()
+    closed.record(True)
+    assert not closed.is_open and closed.allow()
+
+    reopened = opened_breaker()
+    time.sleep(reopened.cooldown)
+    assert reopened.allow()
+    reopened.record(False)
+    assert reopened.is_open and not reopened.allow()
+
+
+def test_is_open_does_not_take_the_probe_slot():
+    scheduler = HostScheduler(failure_threshold=1, cooldown=0.05)
+    url = "https://example.com/a"
+    scheduler.record(url, False)
+    time.sleep(0.05)
+    assert scheduler.is_open(url)
+    assert scheduler.allow(url)
+    assert scheduler.open_hosts() == ["example.com"]
@@ -0,0 +1,45 @@
+from scan_store import PersistentFrontier, ScanStore
+
+
+def test_resume_keeps_results_and_unchecked_urls(tmp_path):
+    path = str(tmp_path / "scan.sqlite")
+    store = ScanStore(path, resume=False)
+    store.record_found("image", "https://example.com/a.jpg")
+    store.record_result("image", "https://example.com/a.jpg", 404)
+    store.record_found("link", "https://example.com/b")
+    store.record_result("link", "https://example.com/c", "load-failure: timeout")
+    store.close()
+
+    resumed = ScanStore(path, resume=True)
+    assert resumed.resumed
+    assert sorted(resumed.results()) == [("image", "https://example.com/a.jpg", 404),
+                                         ("link", "https://example.com/c", "load-failure: timeout")]
+    assert resumed.unchecked() == [("link", "https://example.com/b")]
+    resumed.close()
+
+
+def test_fresh_store_discards_previous_state(tmp_path):
+    path = str(tmp_path / "scan.sqlite")
+    store = ScanStore(path, resume=False)
+    store.record_result("image", "https://example.com/a.jpg", 404)
+    store.close()
+
+    fresh = ScanStore(path, resume=False)
+    assert not fresh.resumed and fresh.results() == []
+    fresh.close()
+
+
+def test_persistent_frontier_resumes_the_queue(tmp_path):
+    path = str(tmp_path / "scan.sqlite")
+    store = ScanStore(path, resume=False)
+    frontier = PersistentFrontier(store, seeds=["https://example.com/"])
+    frontier.push("https://example.com/a")
+    frontier.done("https://example.com/")
+    store.close()
+
+    store = ScanStore(path, resume=True)
+    frontier = PersistentFrontier(store, seeds=["https://example.com/"])
+    assert store.visited() == {"https://example.com/"}
+    assert store.queued() == ["https://example.com/a"]
+    assert not frontier.push("https://example.com/")
+    store.close()
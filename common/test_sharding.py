@@ -0,0 +1,101 @@
+import asyncio
+import time
+
+from crawler import TimeBudget, crawl
+from sharding import run_sharded, spawn_queue
+
+# page -> links on it; a tree, so every page has exactly one depth
+SITE = {
+    "https://example.com/": ["https://example.com/a", "https://example.com/b"],
+    "https://example.com/a": ["https://example.com/a1", "https://example.com/a2"],
+    "https://example.com/b": ["https://example.com/b1"],
+    "https://example.com/a1": [],
+    "https://example.com/a2": [],
+    "https://example.com/b1": [],
+}
+DEPTHS = {
+    "https://example.com/": 0,
+    "https://example.com/a": 1,
+    "https://example.com/b": 1,
+    "https://example.com/a1": 2,
+    "https://example.com/a2": 2,
+    "https://example.com/b1": 2,
+}
+
+
+class FakePage:
+    pass
+
+
+class FakeContext:
+    async def new_page(self):
+        return FakePage()
+
+    async def close(self):
+        pass
+
+
+class FakeBrowser:
+    async def new_context(self):
+        return FakeContext()
+
+
+def by_depth(url, depth):
+    return depth
+
+
+def crawl_fake_site(frontier, budget):
+    """Shard target: crawl SITE and return ``(url, depth)`` for every page this shard visited."""
+    visited = []
+
+    async def visit(page, url):
+        await asyncio.sleep(0.05)
+        visited.append((url, frontier.depth(url)))
+        for link in SITE[url]:
+            frontier.push(link, parent=url)
+
+    asyncio.run(crawl(FakeBrowser(), frontier, visit, budget, pool_size=2))
+    return visited
+
+
+def test_page_cap_is_shared_and_ends_the_sharded_crawl():
+    started = time.monotonic()
+    results = run_sharded(crawl_fake_site, 3, ["https://example.com/"], budget=TimeBudget(15, 3),
+                          priority=by_depth)
+    elapsed = time.monotonic() - started
+
+    visited = [url for shard in results for url, _ in shard]
+    # shards race for the last pages, so a few may start beyond the cap, but never a full cap each
+    assert 3 <= len(visited) < 3 * 3
+    assert elapsed < 10, f"shards idled until the deadline ({elapsed:.1f}s)"
+
+
+def test_routed_urls_keep_their_depth():
+    results = run_sharded(crawl_fake_site, 3, ["https://example.com/"], budget=TimeBudget(15),
+                          priority=by_depth)
+
+    visited = dict(url_depth for shard in results for url_depth in shard)
+    assert visited == DEPTHS
+
+
+def test_resumed_crawl_skips_seen_pages_and_journals_the_frontier():
+    journal = spawn_queue()
+    results = run_sharded(crawl_fake_site, 3, ["https://example.com/b"], budget=TimeBudget(15),
+                          seen={"https://example.com/", "https://example.com/b"}, journal=journal)
+    journal.put(None)
+    events = list(iter(journal.get, None))
+
+    # /b was visited by the earlier run, so it is neither queued nor crawled again
+    assert [url for shard in results for url, _ in shard] == []
+    assert events == []
+
+    journal = spawn_queue()
+    results = run_sharded(crawl_fake_site, 3, ["https://example.com/a"], budget=TimeBudget(15),
+                          seen={"https://example.com/"}, journal=journal)
+    journal.put(None)
+    events = list(iter(journal.get, None))
+
+    visited = {url for shard in results for url, _ in shard}
+    assert visited == {"https://example.com/a", "https://example.com/a1", "https://example.com/a2"}
+    assert {url for event, url in events if event == "queued"} == visited
+    assert {url for event, url in events if event == "visited"} == visited
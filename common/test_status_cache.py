@@ -0,0 +1,54 @@
+import sqlite3
+import time
+
+from sitemaps import unchanged_since_crawl
+from status_cache import StatusCache
+
+URL = "https://example.com/deep/page"
+
+
+def test_status_checks_do_not_count_as_crawls(tmp_path):
+    cache = StatusCache(str(tmp_path / "status.sqlite"))
+    cache.store(URL, 200, {"ETag": '"v1"'})
+    assert cache.get(URL).crawled_at is None
+    assert cache.revalidated(URL) == 200
+    assert cache.get(URL).crawled_at is None
+    assert not unchanged_since_crawl(cache.get(URL), time.time() - 3600)
+    cache.close()
+
+
+def test_crawl_time_survives_later_checks(tmp_path):
+    cache = StatusCache(str(tmp_path / "status.sqlite"))
+    cache.observed(URL, 200)
+    crawled_at = cache.get(URL).crawled_at
+    assert crawled_at is not None
+    cache.store(URL, 200, {"ETag": '"v2"'})
+    cache.revalidated(URL)
+    entry = cache.get(URL)
+    assert entry.crawled_at == crawled_at and entry.etag == '"v2"'
+    assert unchanged_since_crawl(entry, crawled_at - 60)
+    assert not unchanged_since_crawl(entry, crawled_at + 60)
+    cache.close()
+
+
+def test_broken_pages_are_always_recrawled(tmp_path):
+    cache = StatusCache(str(tmp_path / "status.sqlite"))
+    cache.observed(URL, 404)
+    assert not unchanged_since_crawl(cache.get(URL), time.time() - 3600)
+    cache.close()
+
+
+def test_adds_crawled_at_to_an_older_cache(tmp_path):
+    path = str(tmp_path / "status.sqlite")
+    conn = sqlite3.connect(path)
+    conn.execute("CREATE TABLE status (url TEXT PRIMARY KEY, status INTEGER NOT NULL,"
+                 " etag TEXT, last_modified TEXT, checked_at REAL NOT NULL)")
+    conn.execute("INSERT INTO status VALUES (?, 200, NULL, NULL, ?)", (URL, time.time()))
+    conn.commit()
+    conn.close()
+
+    cache = StatusCache(path)
+    assert cache.get(URL).crawled_at is None
+    cache.observed(URL, 200)
+    assert cache.get(URL).crawled_at is not None
+    cache.close()